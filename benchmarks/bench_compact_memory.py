@@ -0,0 +1,89 @@
+"""Measure memory held per subscriber with and without compact parsing.
+
+Parses synthetic ``get_user_info``, ``get_tariff_vservices`` and
+``get_fee_charges`` responses for many subscribers and reports the bytes
+retained per subscriber. Run with the package importable (e.g. after
+``pip install -e .``)::
+
+    python benchmarks/bench_compact_memory.py --subscribers 20000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from pyubilling._parsers import _parse_datetime, parse_list, parse_single
+from pyubilling.models import FeeCharge, TariffVService, UserInfo
+
+TARIFFS = [("Unlim-50", "Unlimited 50 Mbit", "150"), ("Unlim-100", "Unlimited 100 Mbit", "200")]
+
+
+def responses(index: int) -> tuple[bytes, bytes, bytes]:
+    tariff, tariff_name, price = TARIFFS[index % len(TARIFFS)]
+    user = {
+        "login": f"user{index}",
+        "address": f"Main st. {index}",
+        "realname": f"Subscriber {index}",
+        "cash": f"{index % 500}.00",
+        "ip": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+        "tariff": tariff,
+        "tariffalias": tariff,
+        "tariffnm": tariff_name,
+        "accountstate": "active",
+        "currency": "UAH",
+        "version": "1.4",
+    }
+    vservices = [
+        {"tariffname": tariff, "tariffprice": price, "tariffdaysperiod": "30"},
+        {"vsrvname": "Static IP", "vsrvprice": "20", "vsrvdaysperiod": "30"},
+        {"vsrvname": "IPTV", "vsrvprice": "50", "vsrvdaysperiod": "30"},
+    ]
+    charges = [
+        {
+            "date": f"2024-{month:02d}-01 00:00:00",
+            "summ": f"-{price}",
+            "balance": str(index % 500 - month * 10),
+            "note": "Monthly fee",
+            "type": "fee",
+        }
+        for month in range(1, 13)
+    ]
+    return json.dumps(user).encode(), json.dumps(vservices).encode(), json.dumps(charges).encode()
+
+
+def measure(subscribers: int, *, compact: bool) -> float:
+    payloads = [responses(index) for index in range(subscribers)]
+    _parse_datetime.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [
+        (
+            parse_single(user, UserInfo, root_tag="userdata", compact=compact),
+            parse_list(vservices, TariffVService, root_tag="tariffvservices", compact=compact),
+            parse_list(charges, FeeCharge, root_tag="feecharge", compact=compact),
+        )
+        for user, vservices, charges in payloads
+    ]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del held
+    return retained / subscribers
+
+
+def main() -> None:
+    cli = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cli.add_argument("--subscribers", type=int, default=20_000)
+    args = cli.parse_args()
+
+    default = measure(args.subscribers, compact=False)
+    compact = measure(args.subscribers, compact=True)
+    print(f"{args.subscribers} subscribers (user info, 3 services, 12 fee charges each)")
+    print(f"  default  {default:8.0f} bytes/subscriber")
+    print(f"  compact  {compact:8.0f} bytes/subscriber  ({1 - compact / default:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
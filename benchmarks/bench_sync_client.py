@@ -0,0 +1,102 @@
+"""Benchmark UbillingSyncClient against the asyncio.run-per-call pattern.
+
+Both variants are driven from a thread pool, as in a threaded WSGI server,
+against a local HTTP server that counts accepted TCP connections. Run with
+the package importable (e.g. after ``pip install -e .``)::
+
+    python benchmarks/bench_sync_client.py --threads 16 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pyubilling import UbillingClient, UbillingSyncClient
+
+PAYLOAD = json.dumps(
+    {"login": "john", "cash": "123.45", "tariff": "Unlim-100", "currency": "UAH"}
+).encode()
+
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        type(self).connections += 1
+        super().process_request(request, client_address)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def asyncio_run_per_call(base_url: str):
+    async def call():
+        async with UbillingClient(base_url) as client:
+            return await client.get_user_info("john", "md5")
+
+    return lambda: asyncio.run(call())
+
+
+def pooled_sync_client(client: UbillingSyncClient):
+    return lambda: client.get_user_info("john", "md5")
+
+
+def run(label: str, call, threads: int, requests: int) -> None:
+    CountingServer.connections = 0
+    latencies: list[float] = []
+
+    def timed() -> None:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for future in [pool.submit(timed) for _ in range(requests)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<22} {requests / elapsed:8.0f} req/s"
+        f"  p50 {cuts[49] * 1e3:6.2f} ms  p99 {cuts[98] * 1e3:6.2f} ms"
+        f"  sockets {CountingServer.connections}"
+    )
+
+
+def main() -> None:
+    cli = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cli.add_argument("--threads", type=int, default=16)
+    cli.add_argument("--requests", type=int, default=2000)
+    args = cli.parse_args()
+
+    server = CountingServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/billing/userstats"
+
+    print(f"{args.requests} get_user_info calls from {args.threads} threads")
+    run("asyncio.run per call", asyncio_run_per_call(base_url), args.threads, args.requests)
+    with UbillingSyncClient(base_url, max_connections=args.threads) as client:
+        run("UbillingSyncClient", pooled_sync_client(client), args.threads, args.requests)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark the XML fallback parser against the previous implementation.
+
+Run with the package importable (e.g. after ``pip install -e .``)::
+
+    python benchmarks/bench_xml_parse.py
+"""
+
+import timeit
+import xml.etree.ElementTree as ET
+
+from pyubilling import _parsers
+
+
+def legacy_parse_xml_single(raw: bytes, root_tag: str) -> dict | None:
+    root = ET.fromstring(raw)
+    for element in root.iter(root_tag):
+        result = {}
+        for child in element:
+            if child.text is not None:
+                result[child.tag] = child.text
+            result.update(child.attrib)
+        return result
+    return None
+
+
+def legacy_parse_xml_list(raw: bytes, root_tag: str) -> list[dict]:
+    root = ET.fromstring(raw)
+    results = []
+    for element in root.iter(root_tag):
+        row: dict = {}
+        for child in element:
+            if child.text is not None:
+                row[child.tag] = child.text
+            row.update(child.attrib)
+        results.append(row)
+    return results
+
+
+PROLOG = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def make_userdata(*, target_last: bool = False) -> bytes:
+    fields = "".join(
+        f"<{name}>{value}</{name}>"
+        for name, value in [
+            ("login", "john"),
+            ("address", "Main st. 1/2"),
+            ("realname", "John Smith"),
+            ("cash", "123.45"),
+            ("ip", "172.16.0.10"),
+            ("tariff", "Unlim-100"),
+            ("tariffnm", "Unlimited 100 Mbit"),
+            ("accountstate", "active"),
+            ("currency", "UAH"),
+        ]
+    )
+    history = "".join(
+        f"<payment><date>2024-01-{i % 28 + 1:02d} 10:00:00</date><summ>100</summ>"
+        f"<balance>{i}</balance></payment>"
+        for i in range(200)
+    )
+    userdata = f"<userdata>{fields}</userdata>"
+    if target_last:
+        return f"{PROLOG}<data>{history}{userdata}</data>".encode()
+    return f"{PROLOG}<data>{userdata}{history}</data>".encode()
+
+
+def make_creditor() -> bytes:
+    # creditor and paycards answer with the ``data`` document element itself.
+    return f"{PROLOG}<data><status>1</status><message>Credit set</message></data>".encode()
+
+
+def make_fee_charges(rows: int, *, attributes: bool = False) -> bytes:
+    attr = ' currency="UAH"' if attributes else ""
+    body = "".join(
+        f"<feecharge><date>2024-01-{i % 28 + 1:02d} 00:00:00</date><summ{attr}>-10</summ>"
+        f"<balance>{1000 - i}</balance><note>Monthly fee</note><type>fee</type></feecharge>"
+        for i in range(rows)
+    )
+    return f"{PROLOG}<data>{body}</data>".encode()
+
+
+def bench(label: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"  {label:<10} {seconds * 1e6:10.1f} us/call")
+    return seconds
+
+
+def compare(label: str, legacy, current, raw: bytes, root_tag: str, number: int) -> None:
+    assert current(raw, root_tag) == legacy(raw, root_tag)
+    print(f"{label} ({len(raw)} bytes)")
+    old = bench("legacy", lambda: legacy(raw, root_tag), number)
+    new = bench("current", lambda: current(raw, root_tag), number)
+    print(f"  speedup    {old / new:10.2f}x")
+
+
+def main() -> None:
+    for target_last in (False, True):
+        position = "last" if target_last else "first"
+        compare(
+            f"parse_single userdata, target {position}",
+            legacy_parse_xml_single,
+            _parsers._parse_xml_single,
+            make_userdata(target_last=target_last),
+            "userdata",
+            2000,
+        )
+
+    compare(
+        "parse_single data, document element",
+        legacy_parse_xml_single,
+        _parsers._parse_xml_single,
+        make_creditor(),
+        "data",
+        20_000,
+    )
+
+    for rows in (10, 1000, 10_000):
+        for attributes in (False, True):
+            compare(
+                f"parse_list feecharge x{rows}{' with attributes' if attributes else ''}",
+                legacy_parse_xml_list,
+                _parsers._parse_xml_list,
+                make_fee_charges(rows, attributes=attributes),
+                "feecharge",
+                max(1, 20_000 // rows),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 """pyubilling — async Python client for the Ubilling XMLAgent API."""
 
+from pyubilling._balancer import NodeStats
+from pyubilling._scheduler import Priority, QueueStats, request_priority
+from pyubilling.announcements import AnnouncementAggregator, announcement_key
 from pyubilling.client import UbillingClient
 from pyubilling.exceptions import (
     UbillingAuthError,
@@ -8,6 +11,7 @@ from pyubilling.exceptions import (
     UbillingParseError,
     UbillingResponseError,
 )
+from pyubilling.manager import ClientManager, InstallationStats
 from pyubilling.models import (
     AgentData,
     AllowedTariff,
@@ -24,28 +28,53 @@ from pyubilling.models import (
     TicketCreateResult,
     UserInfo,
 )
+from pyubilling.recording import ReplayTransport, TrafficRecord, read_traffic
+from pyubilling.serving import Served, ServingCache
+from pyubilling.sweep import ShardedSweep, SweepProgress, SweepResult
+from pyubilling.sync_client import UbillingSyncClient
+from pyubilling.tickets import TicketChanges, TicketIndex, TicketSync
 
 __all__ = [
     "AgentData",
     "AllowedTariff",
     "Announcement",
+    "AnnouncementAggregator",
+    "ClientManager",
     "CreditInfo",
     "FeeCharge",
     "FreezeData",
     "FreezeResult",
+    "InstallationStats",
+    "NodeStats",
     "PayCardResult",
     "Payment",
     "PaymentSystem",
+    "Priority",
+    "QueueStats",
+    "ReplayTransport",
+    "Served",
+    "ServingCache",
+    "ShardedSweep",
+    "SweepProgress",
+    "SweepResult",
     "TariffVService",
     "Ticket",
+    "TicketChanges",
     "TicketCreateResult",
+    "TicketIndex",
+    "TicketSync",
+    "TrafficRecord",
     "UbillingAuthError",
     "UbillingClient",
     "UbillingConnectionError",
     "UbillingError",
     "UbillingParseError",
     "UbillingResponseError",
+    "UbillingSyncClient",
     "UserInfo",
+    "announcement_key",
+    "read_traffic",
+    "request_priority",
 ]
 
 __version__ = "2.0.0"
@@ -0,0 +1,119 @@
+"""Command line entry point: ``python -m pyubilling loadtest ...``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Callable
+
+from pyubilling.exceptions import UbillingError
+from pyubilling.loadtest import ENDPOINTS, parse_mix, read_credentials, run_loadtest
+from pyubilling.recording import ReplayTransport
+
+
+def _positive(kind: type[int] | type[float]) -> Callable[[str], int | float]:
+    def parse(text: str) -> int | float:
+        try:
+            value = kind(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid number: {text!r}") from None
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+        return value
+
+    return parse
+
+
+_positive_int = _positive(int)
+_positive_float = _positive(float)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m pyubilling")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    loadtest = commands.add_parser(
+        "loadtest",
+        help="generate load against an XMLAgent endpoint",
+        description="Drive UbillingClient with an endpoint mix and report throughput, "
+        "latency (network vs parse), errors and bytes transferred.",
+    )
+    loadtest.add_argument("base_url", nargs="+", help="userstats URL(s) of one installation")
+    loadtest.add_argument(
+        "-c", "--credentials", required=True, help="file with login:password_md5 lines"
+    )
+    loadtest.add_argument(
+        "--plaintext", action="store_true", help="passwords in the file are not MD5-hashed yet"
+    )
+    loadtest.add_argument(
+        "-m",
+        "--mix",
+        default="user_info=1",
+        help="weighted endpoint mix, e.g. 'user_info=70,payments=20,freeze_data=10' "
+        f"(endpoints: {', '.join(ENDPOINTS)})",
+    )
+    rate = loadtest.add_mutually_exclusive_group(required=True)
+    rate.add_argument("--rps", type=_positive_float, help="target requests per second (open loop)")
+    rate.add_argument("--concurrency", type=_positive_int, help="concurrent workers (closed loop)")
+    loadtest.add_argument("-d", "--duration", type=_positive_float, default=30.0, help="seconds")
+    loadtest.add_argument(
+        "--max-in-flight",
+        type=_positive_int,
+        default=1000,
+        help="open-loop cap on outstanding requests",
+    )
+    loadtest.add_argument("--timeout", type=_positive_float, default=5.0)
+    loadtest.add_argument("--uber-key", help="MD5 of the Ubilling serial for extended auth")
+    loadtest.add_argument("--compact", action="store_true", help="use compact parsing")
+    loadtest.add_argument("--replay", metavar="ARCHIVE", help="serve a traffic archive locally")
+    loadtest.add_argument("--latency-scale", type=float, default=1.0, help="for --replay")
+    loadtest.add_argument("--seed", type=int, help="random seed for the endpoint mix")
+    loadtest.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser
+
+
+def _loadtest(args: argparse.Namespace) -> None:
+    transport = None
+    if args.replay:
+        transport = ReplayTransport.from_archive(args.replay, latency_scale=args.latency_scale)
+    report = asyncio.run(
+        run_loadtest(
+            args.base_url,
+            read_credentials(args.credentials, plaintext=args.plaintext),
+            parse_mix(args.mix),
+            duration=args.duration,
+            rps=args.rps,
+            concurrency=args.concurrency,
+            max_in_flight=args.max_in_flight,
+            transport=transport,
+            seed=args.seed,
+            client_options={
+                "timeout": args.timeout,
+                "uber_key": args.uber_key,
+                "compact": args.compact,
+            },
+        )
+    )
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format())
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        if args.command == "loadtest":
+            _loadtest(args)
+    except (UbillingError, OSError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+
+
+def credential_key(login: str, password: str) -> str:
+    """Return a stable key for a login/password pair without storing the password."""
+    return hashlib.sha256(f"{login}\0{password}".encode()).hexdigest()
+
+
+class _AuthCache:
+    """In-memory cache of ``check_auth`` results with single-flight lookups.
+
+    Successful and failed checks are kept for ``ttl`` and ``negative_ttl``
+    seconds respectively. Concurrent lookups for the same credentials share one
+    request. :meth:`invalidate` drops every entry of a login; successful
+    checks of that login that were in flight during the invalidation are not
+    stored.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, *, maxsize: int = 10_000) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        self._entries: dict[str, tuple[str, bool, float]] = {}
+        self._by_login: dict[str, set[str]] = {}
+        # Fetches in flight per login, and invalidations of those logins since
+        # their fetches started; both are dropped when the last fetch ends.
+        self._in_flight: dict[str, int] = {}
+        self._generations: dict[str, int] = {}
+        self._pending: dict[str, asyncio.Future[bool]] = {}
+
+    async def get(
+        self, login: str, password: str, fetch: Callable[[], Awaitable[bool]]
+    ) -> bool:
+        key = credential_key(login, password)
+        entry = self._entries.get(key)
+        if entry is not None:
+            _, result, expires_at = entry
+            if time.monotonic() < expires_at:
+                return result
+            self._discard(key)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(key, login, fetch))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self, key: str, login: str, fetch: Callable[[], Awaitable[bool]]
+    ) -> bool:
+        self._in_flight[login] = self._in_flight.get(login, 0) + 1
+        generation = self._generations.get(login, 0)
+        try:
+            result = await fetch()
+            if not result or self._generations.get(login, 0) == generation:
+                self._store(key, login, result)
+            return result
+        finally:
+            remaining = self._in_flight.pop(login) - 1
+            if remaining:
+                self._in_flight[login] = remaining
+            else:
+                self._generations.pop(login, None)
+
+    def _store(self, key: str, login: str, result: bool) -> None:
+        self._discard(key)
+        while len(self._entries) >= self._maxsize:
+            self._discard(next(iter(self._entries)))
+        ttl = self._ttl if result else self._negative_ttl
+        self._entries[key] = (login, result, time.monotonic() + ttl)
+        self._by_login.setdefault(login, set()).add(key)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_login.get(entry[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_login[entry[0]]
+
+    def invalidate(self, login: str) -> None:
+        if login in self._in_flight:
+            self._generations[login] = self._generations.get(login, 0) + 1
+        for key in self._by_login.pop(login, ()):
+            self._entries.pop(key, None)
@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Literal
+
+type Strategy = Literal["least_outstanding", "ewma"]
+
+
+@dataclass(frozen=True, slots=True)
+class NodeStats:
+    """Point-in-time statistics for a single XMLAgent node."""
+
+    url: str
+    healthy: bool
+    outstanding: int
+    requests: int
+    failures: int
+    consecutive_failures: int
+    ewma_latency: float | None
+    ejections: int
+    ejected_for: float
+
+
+class _Node:
+    __slots__ = (
+        "consecutive_failures",
+        "ejected_until",
+        "ejections",
+        "ewma",
+        "failures",
+        "outstanding",
+        "requests",
+        "url",
+    )
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ewma: float | None = None
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class _Balancer:
+    """Routes requests across XMLAgent nodes and tracks their health passively.
+
+    A node is ejected after ``max_failures`` consecutive failures and re-admitted
+    once its ejection period expires. A re-admitted node that fails again is
+    ejected immediately for twice as long (capped at ``max_eject_time``);
+    a single success resets the streak.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        *,
+        strategy: Strategy = "least_outstanding",
+        max_failures: int = 3,
+        eject_time: float = 10.0,
+        max_eject_time: float = 300.0,
+        ewma_decay: float = 0.3,
+    ) -> None:
+        if strategy not in ("least_outstanding", "ewma"):
+            raise ValueError(f"Unknown balancing strategy: {strategy!r}")
+        self._nodes = [_Node(url) for url in urls]
+        self._strategy = strategy
+        self._max_failures = max_failures
+        self._eject_time = eject_time
+        self._max_eject_time = max_eject_time
+        self._decay = ewma_decay
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _score(self, node: _Node) -> tuple[float, float]:
+        ewma = node.ewma or 0.0
+        if self._strategy == "ewma":
+            return (ewma * (node.outstanding + 1), node.outstanding)
+        return (node.outstanding, ewma)
+
+    def acquire(self, exclude: Collection[str] = ()) -> _Node:
+        """Pick the best node not in ``exclude`` and mark a request outstanding on it.
+
+        If every remaining node is ejected, the one closest to re-admission is
+        used instead of failing outright.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [n for n in self._nodes if n.url not in exclude] or self._nodes
+            healthy = [n for n in candidates if n.is_healthy(now)]
+            if healthy:
+                random.shuffle(healthy)
+                node = min(healthy, key=self._score)
+            else:
+                node = min(candidates, key=lambda n: n.ejected_until)
+            node.outstanding += 1
+            node.requests += 1
+            return node
+
+    def release(self, node: _Node, elapsed: float, *, ok: bool) -> None:
+        with self._lock:
+            node.outstanding -= 1
+            if node.ewma is None:
+                node.ewma = elapsed
+            else:
+                node.ewma += self._decay * (elapsed - node.ewma)
+            if ok:
+                node.consecutive_failures = 0
+                node.ejections = 0
+                return
+            node.failures += 1
+            node.consecutive_failures += 1
+            if node.consecutive_failures >= self._max_failures:
+                period = min(self._eject_time * 2**node.ejections, self._max_eject_time)
+                node.ejected_until = time.monotonic() + period
+                node.ejections += 1
+
+    def cancel(self, node: _Node) -> None:
+        """Release a node without recording an outcome (e.g. on task cancellation)."""
+        with self._lock:
+            node.outstanding -= 1
+
+    def stats(self) -> list[NodeStats]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                NodeStats(
+                    url=n.url,
+                    healthy=n.is_healthy(now),
+                    outstanding=n.outstanding,
+                    requests=n.requests,
+                    failures=n.failures,
+                    consecutive_failures=n.consecutive_failures,
+                    ewma_latency=n.ewma,
+                    ejections=n.ejections,
+                    ejected_for=max(0.0, n.ejected_until - now),
+                )
+                for n in self._nodes
+            ]
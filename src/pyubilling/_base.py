@@ -0,0 +1,148 @@
+import logging
+import time
+from collections.abc import Iterator, Sequence
+from types import TracebackType
+
+import httpx
+from yarl import URL
+
+from pyubilling._balancer import NodeStats, Strategy, _Balancer, _Node
+from pyubilling.exceptions import (
+    UbillingAuthError,
+    UbillingConnectionError,
+    UbillingError,
+    UbillingResponseError,
+)
+
+logger = logging.getLogger("pyubilling")
+
+
+class _Attempt:
+    """One try of a request on one node, used as ``with attempt: ...``.
+
+    On exit the node is released with the outcome, or cancelled if the
+    request was interrupted. A node failure (see
+    :meth:`_BaseClient._is_node_failure`) is suppressed unless this is the
+    last attempt, so the caller's loop moves on to the next node.
+    """
+
+    __slots__ = ("_balancer", "_last", "_method", "node", "started")
+
+    def __init__(self, balancer: _Balancer, node: _Node, method: str, *, last: bool) -> None:
+        self._balancer = balancer
+        self._method = method
+        self._last = last
+        self.node = node
+        self.started = 0.0
+
+    def __enter__(self) -> "_Attempt":
+        self.started = time.monotonic()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        elapsed = time.monotonic() - self.started
+        if exc is None:
+            self._balancer.release(self.node, elapsed, ok=True)
+            return False
+        if not isinstance(exc, UbillingError):
+            self._balancer.cancel(self.node)
+            return False
+        failed = _BaseClient._is_node_failure(exc)
+        self._balancer.release(self.node, elapsed, ok=not failed)
+        if not failed or self._last:
+            return False
+        logger.debug(
+            "%s %s failed, retrying on next node: %s", self._method, self.node.url, exc
+        )
+        return True
+
+
+class _BaseClient:
+    """State and helpers shared by the async and sync clients."""
+
+    def __init__(
+        self,
+        base_url: str | Sequence[str],
+        *,
+        timeout: float,
+        uber_key: str | None,
+        strategy: Strategy,
+        max_failures: int,
+        eject_time: float,
+        compact: bool,
+    ) -> None:
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if not urls:
+            raise UbillingError("At least one base_url is required")
+        for url in urls:
+            self._validate_base_url(url)
+
+        self._base_urls = [str(URL(url)) for url in urls]
+        self._timeout = timeout
+        self._uber_key = uber_key
+        self._compact = compact
+        self._balancer = _Balancer(
+            self._base_urls,
+            strategy=strategy,
+            max_failures=max_failures,
+            eject_time=eject_time,
+        )
+
+    @staticmethod
+    def _validate_base_url(base_url: str) -> None:
+        url = URL(base_url)
+        if url.scheme not in ("http", "https"):
+            raise UbillingError(
+                f"base_url must use http or https scheme, got: {url.scheme!r}"
+            )
+        if not url.host:
+            raise UbillingError("base_url must contain a valid host")
+
+    @staticmethod
+    def _validate_credentials(login: str, password: str) -> None:
+        if not login or not password:
+            raise UbillingAuthError("Both login and password are required")
+
+    def _inject_uber_key(self, params: dict[str, str]) -> dict[str, str]:
+        if self._uber_key:
+            params["uberkey"] = self._uber_key
+        return params
+
+    @staticmethod
+    def _map_http_error(exc: httpx.HTTPError) -> UbillingError:
+        if isinstance(exc, httpx.TimeoutException):
+            return UbillingConnectionError(f"Request timed out: {exc}")
+        if isinstance(exc, httpx.HTTPStatusError):
+            return UbillingResponseError(
+                f"HTTP {exc.response.status_code}: {exc.response.text}",
+                status_code=exc.response.status_code,
+            )
+        return UbillingConnectionError(f"Connection error: {exc}")
+
+    @staticmethod
+    def _is_node_failure(exc: UbillingError) -> bool:
+        """Whether an error counts against the health of the node that raised it."""
+        return not isinstance(exc, UbillingResponseError) or exc.status_code >= 500
+
+    def _attempts(self, method: str, *, idempotent: bool) -> Iterator[_Attempt]:
+        """Yield attempts on the best available nodes.
+
+        Connection errors, timeouts and 5xx responses count against the node's
+        health. Idempotent requests that fail this way are retried once on each
+        of the remaining nodes before the last error is raised.
+        """
+        attempts = len(self._balancer) if idempotent else 1
+        tried: set[str] = set()
+        for attempt in range(attempts):
+            node = self._balancer.acquire(tried)
+            tried.add(node.url)
+            yield _Attempt(self._balancer, node, method, last=attempt == attempts - 1)
+
+    def node_stats(self) -> list[NodeStats]:
+        """Return health and load statistics for every configured base URL."""
+        return self._balancer.stats()
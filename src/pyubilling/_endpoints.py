@@ -1,9 +1,28 @@
 from base64 import b64encode
+from collections.abc import Mapping
+
+_COMMON_PARAMS = frozenset({"xmlagent", "json", "uberlogin", "uberpassword", "uberkey"})
 
 
 class Endpoint:
     """Query parameter builders for each Ubilling XMLAgent endpoint."""
 
+    @staticmethod
+    def name_of(params: Mapping[str, str]) -> str:
+        """Return the logical endpoint name for a set of query parameters.
+
+        This is the endpoint flag (``payments``, ``dofreeze``, ...), the module
+        name for module endpoints (``creditor``, ``creditor.justcheck``,
+        ``paycards``), or ``userdata`` for the plain user info request.
+        """
+        if "module" in params:
+            module = params["module"]
+            return f"{module}.justcheck" if "justcheck" in params else module
+        for key, value in params.items():
+            if value == "true" and key not in _COMMON_PARAMS:
+                return key
+        return "userdata"
+
     @staticmethod
     def _base(login: str, password: str) -> dict[str, str]:
         return {
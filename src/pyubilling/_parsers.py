@@ -1,45 +1,114 @@
 import json
 import logging
+import sys
 import xml.etree.ElementTree as ET
+from contextlib import suppress
+from datetime import datetime
+from functools import lru_cache
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pyubilling.exceptions import UbillingParseError
 
 _logger = logging.getLogger(__name__)
 
+# Raw keys of low-cardinality fields whose values repeat across subscribers:
+# tariff names, currencies, fee notes and types, virtual service names and
+# the titles and ids of provider-wide announcements. Compact parsing interns
+# them so equal values share one string object.
+_INTERNED_KEYS = frozenset(
+    {
+        "currency",
+        "note",
+        "tariff",
+        "tariffalias",
+        "tariffname",
+        "tariffnm",
+        "title",
+        "type",
+        "unic",
+        "vsrvname",
+    }
+)
+_DATETIME_KEYS = frozenset({"date"})
+_datetime_adapter = TypeAdapter(datetime)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    return _datetime_adapter.validate_python(value)
+
+
+def _compact(item: dict) -> dict:
+    """Intern low-cardinality values and share parsed datetimes in place."""
+    for key, value in item.items():
+        if type(value) is not str:
+            continue
+        if key in _INTERNED_KEYS:
+            item[key] = sys.intern(value)
+        elif key in _DATETIME_KEYS:
+            # An invalid value is left for model validation to report.
+            with suppress(ValidationError):
+                item[key] = _parse_datetime(value)
+    return item
+
 
 def _parse_json(raw: bytes) -> dict | list:
     return json.loads(raw)
 
 
+def _xml_row(element: ET.Element) -> dict:
+    row: dict = {}
+    for child in element:
+        if child.text is not None:
+            row[child.tag] = child.text
+        # Most children have no attributes; skip the update call for them.
+        if child.attrib:
+            row.update(child.attrib)
+    return row
+
+
 def _parse_xml_single(raw: bytes, root_tag: str) -> dict | None:
+    """Extract the first ``root_tag`` element in document order.
+
+    When the first closing ``root_tag`` lies in the first half of the
+    document, only the prefix up to it is parsed, and the first opened
+    ``root_tag`` is returned if it closes there (it does not when elements
+    of that name are nested). Otherwise, and always when ``root_tag`` is the
+    document element (``data`` of ``creditor`` or ``paycards``), the whole
+    document is parsed by the C tree builder, as per-event parsing costs
+    more than the skipped tail.
+    """
+    end = raw.find(b"</" + root_tag.encode() + b">")
+    if 0 <= end < len(raw) // 2:
+        parser = ET.XMLPullParser(events=("start", "end"))
+        parser.feed(raw[: end + len(root_tag) + 3])
+        first = None
+        for event, element in parser.read_events():
+            if element.tag != root_tag:
+                continue
+            if first is None:
+                first = element
+            elif event == "end" and element is first:
+                return _xml_row(element)
     root = ET.fromstring(raw)
     for element in root.iter(root_tag):
-        result = {}
-        for child in element:
-            if child.text is not None:
-                result[child.tag] = child.text
-            result.update(child.attrib)
-        return result
+        return _xml_row(element)
     return None
 
 
 def _parse_xml_list(raw: bytes, root_tag: str) -> list[dict]:
     root = ET.fromstring(raw)
-    results = []
-    for element in root.iter(root_tag):
-        row: dict = {}
-        for child in element:
-            if child.text is not None:
-                row[child.tag] = child.text
-            row.update(child.attrib)
-        results.append(row)
-    return results
+    return [_xml_row(element) for element in root.iter(root_tag)]
+
 
+def parse_single[T: BaseModel](
+    raw: bytes, model: type[T], *, root_tag: str, compact: bool = False
+) -> T | None:
+    """Parse response bytes into a single model instance, or None if empty.
 
-def parse_single[T: BaseModel](raw: bytes, model: type[T], *, root_tag: str) -> T | None:
-    """Parse response bytes into a single model instance, or None if empty."""
+    With ``compact``, repeated values share objects (see :func:`_compact`).
+    """
     try:
         data = _parse_json(raw)
     except (json.JSONDecodeError, ValueError):
@@ -57,14 +126,22 @@ def parse_single[T: BaseModel](raw: bytes, model: type[T], *, root_tag: str) ->
         if not data:
             return None
 
+    if compact and isinstance(data, dict):
+        data = _compact(data)
+
     try:
         return model.model_validate(data)
     except Exception as exc:
         raise UbillingParseError(f"Failed to validate {model.__name__}: {exc}") from exc
 
 
-def parse_list[T: BaseModel](raw: bytes, model: type[T], *, root_tag: str) -> list[T]:
-    """Parse response bytes into a list of model instances."""
+def parse_list[T: BaseModel](
+    raw: bytes, model: type[T], *, root_tag: str, compact: bool = False
+) -> list[T]:
+    """Parse response bytes into a list of model instances.
+
+    With ``compact``, repeated values share objects (see :func:`_compact`).
+    """
     try:
         data = _parse_json(raw)
     except (json.JSONDecodeError, ValueError):
@@ -77,6 +154,9 @@ def parse_list[T: BaseModel](raw: bytes, model: type[T], *, root_tag: str) -> li
     if not data:
         return []
 
+    if compact:
+        data = [_compact(item) if isinstance(item, dict) else item for item in data]
+
     try:
         return [model.model_validate(item) for item in data]
     except Exception as exc:
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class Priority(StrEnum):
+    """Request priority class used by the client's request scheduler."""
+
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+DEFAULT_PRIORITY_WEIGHTS: dict[Priority, float] = {
+    Priority.INTERACTIVE: 8.0,
+    Priority.NORMAL: 4.0,
+    Priority.BULK: 1.0,
+}
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "pyubilling_priority", default=Priority.NORMAL
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed requests (and tasks spawned inside) with ``priority``.
+
+    Usage::
+
+        with request_priority(Priority.BULK):
+            await asyncio.gather(*(client.get_user_info(l, p) for l, p in creds))
+    """
+    token = _current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+@dataclass(frozen=True, slots=True)
+class QueueStats:
+    """Queueing statistics for one scheduling class."""
+
+    queued: int
+    in_flight: int
+    admitted: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+
+class _Lane:
+    __slots__ = ("admitted", "in_flight", "max_wait", "pass_", "total_wait", "waiters")
+
+    def __init__(self) -> None:
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.in_flight = 0
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.pass_ = 0.0
+
+
+class _FairScheduler[K]:
+    """Limits concurrent requests and shares the slots between keys by weight.
+
+    Waiting keys are served by stride scheduling (a discrete form of weighted
+    fair queuing): each admission advances the key's virtual pass by
+    ``1 / weight`` and the waiting key with the lowest pass goes next.
+    ``reserved`` holds back slots for a key while it is using fewer than its
+    reservation, so other keys can never occupy them.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        weights: Mapping[K, float] | None = None,
+        *,
+        reserved: Mapping[K, int] | None = None,
+        default_weight: float = 1.0,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self._limit = limit
+        self._weights = dict(weights or {})
+        self._reserved = dict(reserved or {})
+        if sum(self._reserved.values()) >= limit:
+            raise ValueError("reserved slots must leave at least one shared slot")
+        self._default_weight = default_weight
+        self._lanes: dict[K, _Lane] = {}
+        self._in_flight = 0
+
+    def _lane(self, key: K) -> _Lane:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane()
+        return lane
+
+    def _can_start(self, key: K) -> bool:
+        held_back = 0
+        for other, slots in self._reserved.items():
+            if other != key:
+                lane = self._lanes.get(other)
+                held_back += max(0, slots - (lane.in_flight if lane else 0))
+        return self._in_flight < self._limit - held_back
+
+    def _admit(self, key: K, lane: _Lane) -> None:
+        self._in_flight += 1
+        lane.in_flight += 1
+        lane.admitted += 1
+        lane.pass_ += 1.0 / self._weights.get(key, self._default_weight)
+
+    def _virtual_time(self) -> float:
+        active = [lane.pass_ for lane in self._lanes.values() if lane.waiters]
+        return min(active, default=0.0)
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self._limit:
+            ready = [
+                (lane.pass_, key)
+                for key, lane in self._lanes.items()
+                if lane.waiters and self._can_start(key)
+            ]
+            if not ready:
+                return
+            _, key = min(ready, key=lambda item: item[0])
+            lane = self._lanes[key]
+            waiter = lane.waiters.popleft()
+            if waiter.done():
+                continue
+            self._admit(key, lane)
+            waiter.set_result(None)
+
+    def _release(self, key: K) -> None:
+        self._in_flight -= 1
+        self._lanes[key].in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, key: K) -> AsyncIterator[None]:
+        lane = self._lane(key)
+        if not lane.waiters and self._can_start(key):
+            # An idle key must not bank credit while it has nothing queued.
+            lane.pass_ = max(lane.pass_, self._virtual_time())
+            self._admit(key, lane)
+        else:
+            if not lane.waiters:
+                lane.pass_ = max(lane.pass_, self._virtual_time())
+            waiter = asyncio.get_running_loop().create_future()
+            lane.waiters.append(waiter)
+            started = time.monotonic()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release(key)
+                else:
+                    with suppress(ValueError):
+                        lane.waiters.remove(waiter)
+                raise
+            waited = time.monotonic() - started
+            lane.total_wait += waited
+            lane.max_wait = max(lane.max_wait, waited)
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    def stats(self) -> dict[K, QueueStats]:
+        return {
+            key: QueueStats(
+                queued=len(lane.waiters),
+                in_flight=lane.in_flight,
+                admitted=lane.admitted,
+                total_wait=lane.total_wait,
+                max_wait=lane.max_wait,
+            )
+            for key, lane in self._lanes.items()
+        }
@@ -0,0 +1,227 @@
+"""Deduplicated announcements across many subscribers.
+
+Provider-wide announcements are returned to almost every login.
+:class:`AnnouncementAggregator` stores each distinct announcement once and
+keeps, per login, two integer bitmaps over the stored announcements: which
+ones the login receives and which ones it has read. Questions such as "who
+has not seen announcement X" are then answered with bit tests instead of
+per-login copies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+
+from pyubilling.client import UbillingClient
+from pyubilling.exceptions import UbillingError
+from pyubilling.models import Announcement
+
+
+def announcement_key(announcement: Announcement) -> str:
+    """Identity of an announcement: its ``unic``, or a hash of title and text."""
+    if announcement.unic:
+        return announcement.unic
+    digest = hashlib.sha256(f"{announcement.title}\0{announcement.text}".encode())
+    return f"sha256:{digest.hexdigest()}"
+
+
+class AnnouncementAggregator:
+    """One shared copy of each announcement plus per-login bitmaps.
+
+    Each distinct announcement gets a slot number; a login's membership and
+    read state are ints with bit ``slot`` set. The XMLAgent API only marks
+    all of a login's announcements read at once, so read state is recorded
+    by :meth:`mark_read` (locally) and :meth:`mark_read_remote` (through the
+    API).
+
+    Usage::
+
+        aggregator = AnnouncementAggregator()
+        failed = await aggregator.collect(client, credentials, concurrency=20)
+        for announcement in aggregator.announcements():
+            pending = aggregator.unseen_by(announcement_key(announcement))
+            print(announcement.title, len(pending))
+        unseen = set(aggregator.unseen_by(key))
+        selected = [(login, pw) for login, pw in credentials if login in unseen]
+        await aggregator.mark_read_remote(client, selected, concurrency=10)
+    """
+
+    def __init__(self) -> None:
+        self._store: list[Announcement | None] = []
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+        self._members: dict[str, int] = {}
+        self._read: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    @property
+    def logins(self) -> list[str]:
+        return list(self._members)
+
+    def get(self, key: str) -> Announcement | None:
+        slot = self._slots.get(key)
+        return None if slot is None else self._store[slot]
+
+    def announcements(self) -> list[Announcement]:
+        """Every stored announcement."""
+        return self._collect(sorted(self._slots.values()))
+
+    def add(self, login: str, announcements: Iterable[Announcement]) -> int:
+        """Record ``announcements`` as the current set of ``login``.
+
+        Replaces the login's previous membership; read state is kept for
+        announcements it still receives. Returns the number of announcements
+        not stored before.
+        """
+        mask = 0
+        new = 0
+        for announcement in announcements:
+            key = announcement_key(announcement)
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._allocate(key, announcement)
+                new += 1
+            mask |= 1 << slot
+        self._members[login] = mask
+        read = self._read.get(login, 0) & mask
+        if read:
+            self._read[login] = read
+        else:
+            self._read.pop(login, None)
+        return new
+
+    def forget(self, login: str) -> None:
+        self._members.pop(login, None)
+        self._read.pop(login, None)
+
+    def for_login(self, login: str, *, unread_only: bool = False) -> list[Announcement]:
+        mask = self._members.get(login, 0)
+        if unread_only:
+            mask &= ~self._read.get(login, 0)
+        return self._collect(_bits(mask))
+
+    def recipients(self, key: str) -> list[str]:
+        """Logins that receive announcement ``key``."""
+        bit = self._bit(key)
+        return [login for login, mask in self._members.items() if mask & bit]
+
+    def unseen_by(self, key: str) -> list[str]:
+        """Logins that receive announcement ``key`` and have not read it."""
+        bit = self._bit(key)
+        read = self._read
+        return [
+            login
+            for login, mask in self._members.items()
+            if mask & bit and not read.get(login, 0) & bit
+        ]
+
+    def mark_read(self, login: str) -> None:
+        """Record that ``login`` has read all its current announcements."""
+        mask = self._members.get(login, 0)
+        if mask:
+            self._read[login] = mask
+
+    def prune(self) -> int:
+        """Drop announcements no login receives any more; return how many."""
+        used = 0
+        for mask in self._members.values():
+            used |= mask
+        unused = [key for key, slot in self._slots.items() if not used >> slot & 1]
+        for key in unused:
+            slot = self._slots.pop(key)
+            self._store[slot] = None
+            self._free.append(slot)
+        return len(unused)
+
+    async def collect(
+        self,
+        client: UbillingClient,
+        credentials: Iterable[tuple[str, str]],
+        *,
+        concurrency: int = 20,
+    ) -> dict[str, UbillingError]:
+        """Fetch and add the announcements of every login.
+
+        At most ``concurrency`` requests run at once. Returns the errors of
+        logins that could not be fetched; their previous state is kept.
+        """
+
+        async def fetch(login: str, password: str) -> None:
+            self.add(login, await client.get_announcements(login, password))
+
+        return await _for_each(credentials, fetch, concurrency)
+
+    async def mark_read_remote(
+        self,
+        client: UbillingClient,
+        credentials: Iterable[tuple[str, str]],
+        *,
+        concurrency: int = 10,
+    ) -> dict[str, UbillingError]:
+        """Call ``mark_announcements_read`` for each login, ``concurrency`` at a time.
+
+        Logins marked successfully have all their announcements recorded as
+        read. Returns the errors of the logins that failed.
+        """
+
+        async def mark(login: str, password: str) -> None:
+            await client.mark_announcements_read(login, password)
+            self.mark_read(login)
+
+        return await _for_each(credentials, mark, concurrency)
+
+    def _allocate(self, key: str, announcement: Announcement) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._store[slot] = announcement
+        else:
+            slot = len(self._store)
+            self._store.append(announcement)
+        self._slots[key] = slot
+        return slot
+
+    def _collect(self, slots: Iterable[int]) -> list[Announcement]:
+        return [
+            announcement
+            for slot in slots
+            if (announcement := self._store[slot]) is not None
+        ]
+
+    def _bit(self, key: str) -> int:
+        slot = self._slots.get(key)
+        return 0 if slot is None else 1 << slot
+
+
+def _bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+async def _for_each(
+    credentials: Iterable[tuple[str, str]],
+    call: Callable[[str, str], Awaitable[None]],
+    concurrency: int,
+) -> dict[str, UbillingError]:
+    pending = iter(credentials)
+    errors: dict[str, UbillingError] = {}
+
+    async def consume() -> None:
+        for login, password in pending:
+            try:
+                await call(login, password)
+            except UbillingError as exc:
+                errors[login] = exc
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(max(1, concurrency)):
+            group.create_task(consume())
+    return errors
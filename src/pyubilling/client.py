@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Mapping, Sequence
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    suppress,
+)
 
 import httpx
-from yarl import URL
 
+from pyubilling._authcache import _AuthCache
+from pyubilling._balancer import Strategy
+from pyubilling._base import _BaseClient
 from pyubilling._endpoints import Endpoint
 from pyubilling._parsers import parse_list, parse_single
-from pyubilling.exceptions import (
-    UbillingAuthError,
-    UbillingConnectionError,
-    UbillingError,
-    UbillingResponseError,
+from pyubilling._scheduler import (
+    DEFAULT_PRIORITY_WEIGHTS,
+    Priority,
+    QueueStats,
+    _FairScheduler,
+    current_priority,
 )
+from pyubilling.exceptions import UbillingError, UbillingResponseError
 from pyubilling.models import (
     AgentData,
     AllowedTariff,
@@ -29,11 +42,61 @@ from pyubilling.models import (
     TicketCreateResult,
     UserInfo,
 )
+from pyubilling.recording import _TrafficWriter
 
 logger = logging.getLogger("pyubilling")
 
+_AUTH_ERROR_STATUSES = frozenset({401, 403})
+
+# Read-only API methods that take just (login, password).
+_READ_METHODS = frozenset(
+    {
+        "get_user_info",
+        "check_auth",
+        "get_payments",
+        "get_fee_charges",
+        "get_announcements",
+        "get_tickets",
+        "get_payment_systems",
+        "check_credit",
+        "get_agent_data",
+        "get_tariff_vservices",
+        "get_allowed_tariffs",
+        "get_active_tariffs_vservices",
+        "get_freeze_data",
+    }
+)
+
+# Incremented in forked children, so lazy clients can tell that their
+# connection pool was inherited from the parent process.
+_fork_generation = 0
+
+
+def _after_fork() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
 
-class UbillingClient:
+
+async def _close_with_loop(client: httpx.AsyncClient, generation: int) -> AsyncGenerator[None]:
+    """Close ``client`` when the event loop running this generator shuts down.
+
+    ``asyncio.run`` finalizes suspended async generators before closing its
+    loop, so the ``finally`` runs while the pool's loop is still usable. In a
+    forked child (``generation`` is outdated) the pool's sockets are shared
+    with the parent, and nothing is closed.
+    """
+    try:
+        yield
+    finally:
+        if generation == _fork_generation and not client.is_closed:
+            await client.aclose()
+
+
+class UbillingClient(_BaseClient):
     """Async client for Ubilling XMLAgent API.
 
     All API methods require ``login`` and ``password`` parameters.
@@ -44,6 +107,46 @@ class UbillingClient:
     (``XMLAGENT_EXTENDED_AUTH_ON``), pass ``uber_key`` — the MD5 hash
     of your Ubilling instance serial number.
 
+    ``base_url`` may also be a list of userstats URLs serving the same
+    installation. Requests are then routed by ``strategy``
+    (``"least_outstanding"`` or latency ``"ewma"``), nodes that fail
+    ``max_failures`` times in a row are ejected for ``eject_time`` seconds,
+    and failed read requests are retried on another node. Per-node
+    statistics are available from :meth:`node_stats`.
+
+    ``max_concurrency`` caps in-flight requests and shares the slots between
+    priority classes by ``priority_weights`` (weighted fair queuing), so
+    interactive calls are not starved by bulk sweeps. ``reserved_interactive``
+    slots are never given to lower classes. Select the class of the enclosed
+    calls with :func:`request_priority`; queue waits are reported by
+    :meth:`queue_stats`.
+
+    ``auth_cache_ttl`` enables an in-memory cache of :meth:`check_auth`
+    results, keyed on a hash of login and password. Failed checks are kept
+    for ``auth_cache_negative_ttl`` seconds (only 401/403 answers count as
+    failed; other error statuses are never cached), concurrent checks of the
+    same credentials share one request, and a 401/403 response to any other
+    request of a login drops its cached results.
+
+    With ``compact=True``, values of low-cardinality fields (tariffs,
+    currencies, fee notes, ...) are interned and parsed dates are memoized,
+    so results held for many subscribers share equal values.
+
+    With ``lazy=True`` the client can be created once per process and used
+    without ``async with``: the connection pool is opened on first request
+    and kept warm across calls. It is rebuilt, without closing the old one,
+    when the process has forked (pre-fork servers, Celery prefork workers)
+    or the client is used from a different event loop, and reopened if it
+    was closed. A custom ``transport`` is reused as is. Connections belong to
+    the event loop that opened them: they stay warm only while one
+    long-lived loop is used, and each new loop (e.g. ``asyncio.run`` per
+    Celery task) opens a new pool, which is closed when that loop shuts down.
+
+    ``transport`` replaces the underlying httpx transport (for example with
+    :class:`~pyubilling.recording.ReplayTransport`). ``record_to`` appends
+    every exchange to a traffic archive at that path, with passwords and the
+    uber key redacted.
+
     Usage::
 
         async with UbillingClient("http://demo.ubilling.net.ua:9999/billing/userstats") as client:
@@ -55,93 +158,224 @@ class UbillingClient:
 
     def __init__(
         self,
-        base_url: str,
+        base_url: str | Sequence[str],
         *,
         timeout: float = 5.0,
         uber_key: str | None = None,
+        strategy: Strategy = "least_outstanding",
+        max_failures: int = 3,
+        eject_time: float = 10.0,
+        compact: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        record_to: str | os.PathLike[str] | None = None,
+        max_concurrency: int | None = None,
+        priority_weights: Mapping[Priority, float] | None = None,
+        reserved_interactive: int = 0,
+        auth_cache_ttl: float | None = None,
+        auth_cache_negative_ttl: float = 2.0,
+        lazy: bool = False,
     ) -> None:
-        url = URL(base_url)
-        if url.scheme not in ("http", "https"):
-            raise UbillingError(
-                f"base_url must use http or https scheme, got: {url.scheme!r}"
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            uber_key=uber_key,
+            strategy=strategy,
+            max_failures=max_failures,
+            eject_time=eject_time,
+            compact=compact,
+        )
+        self._max_concurrency = max_concurrency
+        self._scheduler: _FairScheduler[Priority] | None = None
+        if max_concurrency is not None:
+            self._scheduler = _FairScheduler(
+                max_concurrency,
+                priority_weights or DEFAULT_PRIORITY_WEIGHTS,
+                reserved={Priority.INTERACTIVE: reserved_interactive},
             )
-        if not url.host:
-            raise UbillingError("base_url must contain a valid host")
-
-        self._base_url = str(url)
-        self._timeout = timeout
-        self._uber_key = uber_key
+        self._auth_cache: _AuthCache | None = None
+        if auth_cache_ttl is not None:
+            self._auth_cache = _AuthCache(auth_cache_ttl, auth_cache_negative_ttl)
+        self._transport = transport
+        self._record_to = record_to
+        self._recorder: _TrafficWriter | None = None
         self._client: httpx.AsyncClient | None = None
+        self._lazy = lazy
+        self._client_fork = _fork_generation
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._closer: AsyncGenerator[None] | None = None
+        # Extra admission step shared with other clients (set by ClientManager).
+        self._limiter: Callable[[], AbstractAsyncContextManager[None]] | None = None
 
     async def __aenter__(self) -> UbillingClient:
+        self._open()
+        return self
+
+    def _open(self) -> httpx.AsyncClient:
+        limits = httpx.Limits()
+        if self._max_concurrency is not None:
+            limits = httpx.Limits(max_connections=self._max_concurrency)
+        transport = self._transport
+        if self._record_to is not None:
+            if self._recorder is None:
+                self._recorder = _TrafficWriter(self._record_to)
+            transport = self._recorder.tap(transport or httpx.AsyncHTTPTransport(limits=limits))
         self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
+            timeout=self._timeout, limits=limits, transport=transport
         )
-        return self
+        self._client_fork = _fork_generation
+        self._client_loop = asyncio.get_running_loop()
+        if self._lazy:
+            # Starting the generator registers it with the running loop, which
+            # finalizes it on shutdown; the strong reference keeps it alive.
+            self._closer = _close_with_loop(self._client, _fork_generation)
+            with suppress(StopIteration):
+                self._closer.asend(None).send(None)
+        return self._client
+
+    def _is_inherited(self) -> bool:
+        """Whether the open pool belongs to a parent process or another event loop."""
+        if self._client_fork != _fork_generation:
+            return True
+        try:
+            return self._client_loop is not asyncio.get_running_loop()
+        except RuntimeError:
+            return False
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
     async def close(self) -> None:
+        forked = self._client_fork != _fork_generation
         if self._client is not None:
-            await self._client.aclose()
+            if not (self._lazy and self._is_inherited()):
+                await self._client.aclose()
             self._client = None
+        closer = self._drop_closer(forked)
+        if closer is not None and not self._is_inherited():
+            await closer.aclose()
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _drop_closer(self, forked: bool) -> AsyncGenerator[None] | None:
+        closer, self._closer = self._closer, None
+        if closer is not None and forked:
+            # Finish the parent's closer here, where it does nothing, so that
+            # it is never finalized through the parent's event loop.
+            with suppress(StopIteration):
+                closer.aclose().send(None)
+            return None
+        return closer
 
     def _ensure_client(self) -> httpx.AsyncClient:
+        if self._lazy:
+            return self._ensure_lazy_client()
         if self._client is None:
             raise UbillingError(
                 "Client is not open. Use 'async with UbillingClient(...) as client:'"
             )
         return self._client
 
-    @staticmethod
-    def _validate_credentials(login: str, password: str) -> None:
-        if not login or not password:
-            raise UbillingAuthError("Both login and password are required")
-
-    def _inject_uber_key(self, params: dict[str, str]) -> dict[str, str]:
-        if self._uber_key:
-            params["uberkey"] = self._uber_key
-        return params
-
-    async def _get(self, params: dict[str, str]) -> bytes:
+    def _ensure_lazy_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is not None and not client.is_closed and not self._is_inherited():
+            return client
+        forked = self._client_fork != _fork_generation
+        # An inherited pool's sockets are shared with the parent process or
+        # bound to another event loop, which closes it when it shuts down, so
+        # it is dropped rather than closed here.
+        self._drop_closer(forked)
+        logger.debug("Opening connection pool for %s", self._base_urls[0])
+        return self._open()
+
+    def queue_stats(self) -> dict[Priority, QueueStats]:
+        """Return queue wait statistics per priority class.
+
+        Empty unless the client was created with ``max_concurrency``.
+        """
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.stats()
+
+    def invalidate_auth(self, login: str) -> None:
+        """Drop cached ``check_auth`` results for ``login``."""
+        if self._auth_cache is not None:
+            self._auth_cache.invalidate(login)
+
+    async def _send(
+        self, url: str, method: str, params: dict[str, str], body: dict | None
+    ) -> httpx.Response:
+        # Lazy clients reopen closed or inherited pools here, right before
+        # sending; errors raised once the request is on its way are not
+        # retried, since the server may already have acted on it.
         client = self._ensure_client()
-        params = self._inject_uber_key(params)
         try:
-            response = await client.get("", params=params)
+            response = await client.request(method, url, params=params, json=body)
             response.raise_for_status()
-        except httpx.TimeoutException as exc:
-            raise UbillingConnectionError(f"Request timed out: {exc}") from exc
-        except httpx.HTTPStatusError as exc:
-            raise UbillingResponseError(
-                f"HTTP {exc.response.status_code}: {exc.response.text}",
-                status_code=exc.response.status_code,
-            ) from exc
         except httpx.HTTPError as exc:
-            raise UbillingConnectionError(f"Connection error: {exc}") from exc
-
-        logger.debug("GET %s -> %d bytes", response.url, len(response.content))
-        return response.content
+            raise self._map_http_error(exc) from exc
+        return response
 
-    async def _post(self, params: dict[str, str], body: dict) -> bytes:
-        client = self._ensure_client()
+    async def _request(
+        self,
+        method: str,
+        params: dict[str, str],
+        body: dict | None = None,
+        *,
+        idempotent: bool,
+    ) -> bytes:
+        """Send a request, first waiting for a slot in the lane of the current
+        :func:`request_priority` when ``max_concurrency`` is set.
+        """
+        self._ensure_client()
         params = self._inject_uber_key(params)
         try:
-            response = await client.post("", params=params, json=body)
-            response.raise_for_status()
-        except httpx.TimeoutException as exc:
-            raise UbillingConnectionError(f"Request timed out: {exc}") from exc
-        except httpx.HTTPStatusError as exc:
-            raise UbillingResponseError(
-                f"HTTP {exc.response.status_code}: {exc.response.text}",
-                status_code=exc.response.status_code,
-            ) from exc
-        except httpx.HTTPError as exc:
-            raise UbillingConnectionError(f"Connection error: {exc}") from exc
+            if self._scheduler is None and self._limiter is None:
+                return await self._attempt(method, params, body, idempotent=idempotent)
+            async with self._admission():
+                return await self._attempt(method, params, body, idempotent=idempotent)
+        except UbillingResponseError as exc:
+            # A rejected justauth only says that this password is wrong; it
+            # must not evict the login's other cached results.
+            if (
+                exc.status_code in _AUTH_ERROR_STATUSES
+                and "uberlogin" in params
+                and "justauth" not in params
+            ):
+                self.invalidate_auth(params["uberlogin"])
+            raise
+
+    @asynccontextmanager
+    async def _admission(self) -> AsyncIterator[None]:
+        """Hold the priority slot, then the shared limiter slot, for one request."""
+        async with AsyncExitStack() as stack:
+            if self._scheduler is not None:
+                await stack.enter_async_context(self._scheduler.slot(current_priority()))
+            if self._limiter is not None:
+                await stack.enter_async_context(self._limiter())
+            yield
+
+    async def _attempt(
+        self,
+        method: str,
+        params: dict[str, str],
+        body: dict | None,
+        *,
+        idempotent: bool,
+    ) -> bytes:
+        """Send a request, retrying on other nodes as described in :meth:`_attempts`."""
+        for attempt in self._attempts(method, idempotent=idempotent):
+            with attempt:
+                response = await self._send(attempt.node.url, method, params, body)
+                logger.debug("%s %s -> %d bytes", method, response.url, len(response.content))
+                return response.content
+        raise AssertionError("unreachable")
+
+    async def _get(self, params: dict[str, str], *, idempotent: bool = True) -> bytes:
+        return await self._request("GET", params, idempotent=idempotent)
 
-        logger.debug("POST %s -> %d bytes", response.url, len(response.content))
-        return response.content
+    async def _post(self, params: dict[str, str], body: dict) -> bytes:
+        return await self._request("POST", params, body, idempotent=False)
 
     # -- User data --
 
@@ -154,22 +388,38 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.user_info(login, password))
-        return parse_single(raw, UserInfo, root_tag="userdata")
+        return parse_single(raw, UserInfo, root_tag="userdata", compact=self._compact)
 
     async def check_auth(self, login: str, password: str) -> bool:
         """Check if credentials are valid without returning user data.
 
+        Results are cached when the client was created with ``auth_cache_ttl``.
+
         Args:
             login: User login.
             password: MD5 hash of user password.
         """
         self._validate_credentials(login, password)
         try:
-            await self._get(Endpoint.just_auth(login, password))
-            return True
+            if self._auth_cache is not None:
+                return await self._auth_cache.get(
+                    login, password, lambda: self._check_auth(login, password)
+                )
+            return await self._check_auth(login, password)
         except UbillingResponseError:
+            # Other error statuses say nothing reliable about the credentials,
+            # so they are reported as a failed check but never cached.
             return False
 
+    async def _check_auth(self, login: str, password: str) -> bool:
+        try:
+            await self._get(Endpoint.just_auth(login, password))
+        except UbillingResponseError as exc:
+            if exc.status_code not in _AUTH_ERROR_STATUSES:
+                raise
+            return False
+        return True
+
     # -- Payments & charges --
 
     async def get_payments(self, login: str, password: str) -> list[Payment]:
@@ -181,7 +431,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.payments(login, password))
-        return parse_list(raw, Payment, root_tag="payment")
+        return parse_list(raw, Payment, root_tag="payment", compact=self._compact)
 
     async def get_fee_charges(
         self,
@@ -203,7 +453,7 @@ class UbillingClient:
         raw = await self._get(
             Endpoint.fee_charges(login, password, date_from=date_from, date_to=date_to)
         )
-        return parse_list(raw, FeeCharge, root_tag="feecharge")
+        return parse_list(raw, FeeCharge, root_tag="feecharge", compact=self._compact)
 
     # -- Announcements --
 
@@ -216,7 +466,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.announcements(login, password))
-        return parse_list(raw, Announcement, root_tag="data")
+        return parse_list(raw, Announcement, root_tag="data", compact=self._compact)
 
     async def mark_announcements_read(self, login: str, password: str) -> None:
         """Mark all user announcements as read.
@@ -226,7 +476,9 @@ class UbillingClient:
             password: MD5 hash of user password.
         """
         self._validate_credentials(login, password)
-        await self._get(Endpoint.announcements_read_all(login, password))
+        await self._get(
+            Endpoint.announcements_read_all(login, password), idempotent=False
+        )
 
     # -- Tickets --
 
@@ -239,7 +491,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.tickets(login, password))
-        return parse_list(raw, Ticket, root_tag="ticket")
+        return parse_list(raw, Ticket, root_tag="ticket", compact=self._compact)
 
     async def create_ticket(
         self,
@@ -261,9 +513,10 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(
-            Endpoint.ticket_create(login, password, text, reply_id=reply_id)
+            Endpoint.ticket_create(login, password, text, reply_id=reply_id),
+            idempotent=False,
         )
-        return parse_single(raw, TicketCreateResult, root_tag="data")
+        return parse_single(raw, TicketCreateResult, root_tag="data", compact=self._compact)
 
     async def create_signup_request(
         self,
@@ -307,7 +560,7 @@ class UbillingClient:
             "notes": notes,
         }
         raw = await self._post(Endpoint.signup_request(login, password), body)
-        return parse_single(raw, TicketCreateResult, root_tag="data")
+        return parse_single(raw, TicketCreateResult, root_tag="data", compact=self._compact)
 
     # -- Payment systems --
 
@@ -320,7 +573,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.payment_systems(login, password))
-        return parse_list(raw, PaymentSystem, root_tag="paysys")
+        return parse_list(raw, PaymentSystem, root_tag="paysys", compact=self._compact)
 
     # -- Credit --
 
@@ -332,8 +585,8 @@ class UbillingClient:
             password: MD5 hash of user password.
         """
         self._validate_credentials(login, password)
-        raw = await self._get(Endpoint.credit(login, password))
-        return parse_single(raw, CreditInfo, root_tag="data")
+        raw = await self._get(Endpoint.credit(login, password), idempotent=False)
+        return parse_single(raw, CreditInfo, root_tag="data", compact=self._compact)
 
     async def check_credit(self, login: str, password: str) -> CreditInfo | None:
         """Check if credit can be set (without actually setting it).
@@ -344,7 +597,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.check_credit(login, password))
-        return parse_single(raw, CreditInfo, root_tag="data")
+        return parse_single(raw, CreditInfo, root_tag="data", compact=self._compact)
 
     # -- Pay cards --
 
@@ -359,8 +612,10 @@ class UbillingClient:
             card_number: Prepaid card number.
         """
         self._validate_credentials(login, password)
-        raw = await self._get(Endpoint.pay_card(login, password, card_number))
-        return parse_single(raw, PayCardResult, root_tag="data")
+        raw = await self._get(
+            Endpoint.pay_card(login, password, card_number), idempotent=False
+        )
+        return parse_single(raw, PayCardResult, root_tag="data", compact=self._compact)
 
     # -- Agent / contractor --
 
@@ -373,7 +628,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.agent_assigned(login, password))
-        return parse_single(raw, AgentData, root_tag="agentdata")
+        return parse_single(raw, AgentData, root_tag="agentdata", compact=self._compact)
 
     # -- Tariffs & virtual services --
 
@@ -388,7 +643,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.tariff_vservices(login, password))
-        return parse_list(raw, TariffVService, root_tag="tariffvservices")
+        return parse_list(raw, TariffVService, root_tag="tariffvservices", compact=self._compact)
 
     async def get_allowed_tariffs(
         self, login: str, password: str
@@ -403,7 +658,12 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.tariffs_to_switch(login, password))
-        return parse_list(raw, AllowedTariff, root_tag="tarifftoswitchallowed")
+        return parse_list(
+            raw,
+            AllowedTariff,
+            root_tag="tarifftoswitchallowed",
+            compact=self._compact,
+        )
 
     async def get_active_tariffs_vservices(
         self, login: str, password: str
@@ -416,7 +676,12 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.active_tariffs_vservices(login, password))
-        return parse_list(raw, TariffVService, root_tag="activetariffsvservices")
+        return parse_list(
+            raw,
+            TariffVService,
+            root_tag="activetariffsvservices",
+            compact=self._compact,
+        )
 
     # -- Freeze / unfreeze --
 
@@ -429,7 +694,7 @@ class UbillingClient:
         """
         self._validate_credentials(login, password)
         raw = await self._get(Endpoint.freeze_data(login, password))
-        return parse_single(raw, FreezeData, root_tag="freezedata")
+        return parse_single(raw, FreezeData, root_tag="freezedata", compact=self._compact)
 
     async def freeze_user(self, login: str, password: str) -> FreezeResult | None:
         """Freeze the user account.
@@ -439,8 +704,8 @@ class UbillingClient:
             password: MD5 hash of user password.
         """
         self._validate_credentials(login, password)
-        raw = await self._get(Endpoint.do_freeze(login, password))
-        return parse_single(raw, FreezeResult, root_tag="dofreeze")
+        raw = await self._get(Endpoint.do_freeze(login, password), idempotent=False)
+        return parse_single(raw, FreezeResult, root_tag="dofreeze", compact=self._compact)
 
     async def unfreeze_user(self, login: str, password: str) -> FreezeResult | None:
         """Unfreeze the user account.
@@ -452,16 +717,19 @@ class UbillingClient:
             password: MD5 hash of user password.
         """
         self._validate_credentials(login, password)
-        raw = await self._get(Endpoint.do_unfreeze(login, password))
-        return parse_single(raw, FreezeResult, root_tag="dofreeze")
+        raw = await self._get(Endpoint.do_unfreeze(login, password), idempotent=False)
+        return parse_single(raw, FreezeResult, root_tag="dofreeze", compact=self._compact)
 
     # -- Connection check --
 
     async def check_connection(self) -> bool:
-        """Verify the API endpoint is reachable."""
+        """Verify that at least one API endpoint is reachable."""
         client = self._ensure_client()
-        try:
-            response = await client.get("")
-            return response.is_success
-        except httpx.HTTPError:
-            return False
+        for url in self._base_urls:
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError:
+                continue
+            if response.is_success:
+                return True
+        return False
@@ -0,0 +1,311 @@
+"""Load generation against an XMLAgent endpoint.
+
+Drives :class:`~pyubilling.client.UbillingClient` with a weighted mix of read
+endpoints, either at a target request rate (open loop) or with a fixed number
+of concurrent workers (closed loop), and reports throughput, latency
+percentiles split into network and parse time, errors by exception class and
+bytes transferred. Used by ``python -m pyubilling loadtest``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import random
+import time
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from pyubilling.client import UbillingClient
+from pyubilling.exceptions import UbillingError
+from pyubilling.recording import _TapTransport
+
+# Read-only endpoints that are safe to hammer, by mix name. Logical endpoint
+# names (as in traffic archives) are accepted as aliases.
+ENDPOINTS: dict[str, str] = {
+    "user_info": "get_user_info",
+    "auth": "check_auth",
+    "payments": "get_payments",
+    "fee_charges": "get_fee_charges",
+    "announcements": "get_announcements",
+    "tickets": "get_tickets",
+    "payment_systems": "get_payment_systems",
+    "check_credit": "check_credit",
+    "agent_data": "get_agent_data",
+    "tariff_vservices": "get_tariff_vservices",
+    "allowed_tariffs": "get_allowed_tariffs",
+    "active_tariffs_vservices": "get_active_tariffs_vservices",
+    "freeze_data": "get_freeze_data",
+}
+_ALIASES: dict[str, str] = {
+    "userdata": "user_info",
+    "justauth": "auth",
+    "feecharges": "fee_charges",
+    "opayz": "payment_systems",
+    "creditor.justcheck": "check_credit",
+    "agentassigned": "agent_data",
+    "tariffvservices": "tariff_vservices",
+    "tarifftoswitchallowed": "allowed_tariffs",
+    "activetariffsvservices": "active_tariffs_vservices",
+    "freezedata": "freeze_data",
+}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse an endpoint mix such as ``"user_info=70,payments=20,freezedata=10"``."""
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        name = _ALIASES.get(name, name)
+        if name not in ENDPOINTS:
+            raise UbillingError(
+                f"Unknown endpoint {name!r}; choose from {', '.join(sorted(ENDPOINTS))}"
+            )
+        try:
+            mix[name] = mix.get(name, 0.0) + float(weight or 1)
+        except ValueError:
+            raise UbillingError(f"Invalid weight for {name!r}: {weight!r}") from None
+    if not mix or sum(mix.values()) <= 0:
+        raise UbillingError("Endpoint mix must have a positive total weight")
+    return mix
+
+
+def read_credentials(
+    path: str | os.PathLike[str], *, plaintext: bool = False
+) -> list[tuple[str, str]]:
+    """Read ``login:password`` (or ``login,password`` / whitespace separated) lines.
+
+    Blank lines and ``#`` comments are skipped. With ``plaintext``, passwords
+    are MD5-hashed as the API expects.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            lines = list(file)
+    except UnicodeDecodeError as exc:
+        raise UbillingError(f"{path}: not a UTF-8 text file: {exc}") from exc
+    credentials = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for separator in (":", ",", None):
+            login, *rest = line.split(separator, 1)
+            if rest:
+                break
+        else:
+            raise UbillingError(f"{path}:{number}: expected 'login:password'")
+        password = rest[0].strip()
+        if plaintext:
+            password = hashlib.md5(password.encode()).hexdigest()
+        credentials.append((login.strip(), password))
+    if not credentials:
+        raise UbillingError(f"No credentials in {path}")
+    return credentials
+
+
+@dataclass(slots=True)
+class _Sample:
+    network: float = 0.0
+    received: int = 0
+    sent: int = 0
+
+
+_current_sample: ContextVar[_Sample | None] = ContextVar("pyubilling_loadtest", default=None)
+
+
+def _on_exchange(
+    request: httpx.Request, response: httpx.Response, raw: bytes, elapsed: float
+) -> None:
+    sample = _current_sample.get()
+    if sample is None:
+        return
+    sample.network += elapsed
+    sample.received += len(raw) + sum(len(k) + len(v) + 4 for k, v in response.headers.raw)
+    sample.sent += len(request.url.raw_path) + len(request.content) + sum(
+        len(k) + len(v) + 4 for k, v in request.headers.raw
+    )
+
+
+def _percentiles(values: Sequence[float]) -> dict[str, float]:
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {
+        "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50": rank(0.50),
+        "p90": rank(0.90),
+        "p99": rank(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+@dataclass(slots=True)
+class LoadTestReport:
+    """Aggregated load test results. Latencies are in milliseconds."""
+
+    duration: float = 0.0
+    requests: int = 0
+    dropped: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    total: list[float] = field(default_factory=list)
+    network: list[float] = field(default_factory=list)
+    parse: list[float] = field(default_factory=list)
+    by_endpoint: dict[str, list[float]] = field(default_factory=dict)
+    errors_by_endpoint: Counter[str] = field(default_factory=Counter)
+
+    def add(self, endpoint: str, total: float, sample: _Sample, error: str | None) -> None:
+        self.requests += 1
+        self.total.append(total)
+        self.network.append(sample.network)
+        self.parse.append(max(0.0, total - sample.network))
+        self.bytes_received += sample.received
+        self.bytes_sent += sample.sent
+        self.by_endpoint.setdefault(endpoint, []).append(total)
+        if error is not None:
+            self.errors[error] += 1
+            self.errors_by_endpoint[endpoint] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration": round(self.duration, 3),
+            "requests": self.requests,
+            "throughput": round(self.requests / self.duration, 2) if self.duration else 0.0,
+            "dropped": self.dropped,
+            "errors": dict(self.errors),
+            "error_rate": round(self.errors.total() / self.requests, 4) if self.requests else 0,
+            "bytes_received": self.bytes_received,
+            "bytes_sent": self.bytes_sent,
+            "latency_ms": {
+                "total": _percentiles(self.total),
+                "network": _percentiles(self.network),
+                "parse": _percentiles(self.parse),
+            },
+            "endpoints": {
+                name: {
+                    "requests": len(values),
+                    "errors": self.errors_by_endpoint[name],
+                    "latency_ms": _percentiles(values),
+                }
+                for name, values in sorted(self.by_endpoint.items())
+            },
+        }
+
+    def format(self) -> str:
+        data = self.to_dict()
+        lines = [
+            f"duration    {data['duration']:.1f} s",
+            f"requests    {data['requests']}  ({data['throughput']:.1f} req/s)",
+            f"errors      {sum(data['errors'].values())}  ({data['error_rate']:.2%})",
+        ]
+        lines += [f"  {name:<28} {count}" for name, count in sorted(data["errors"].items())]
+        if data["dropped"]:
+            lines.append(f"dropped     {data['dropped']} (in-flight limit reached)")
+        lines.append(
+            f"transferred {data['bytes_received']} B received, {data['bytes_sent']} B sent"
+        )
+        lines.append(f"{'latency ms':<12}{'mean':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+        for kind, stats in data["latency_ms"].items():
+            lines.append(f"  {kind:<10}" + "".join(f"{stats[k]:>9.2f}" for k in stats))
+        lines.append("endpoints")
+        for name, stats in data["endpoints"].items():
+            latency = stats["latency_ms"]
+            lines.append(
+                f"  {name:<26} {stats['requests']:>7} req {stats['errors']:>5} err"
+                f"  p50 {latency['p50']:.2f}  p99 {latency['p99']:.2f}"
+            )
+        return "\n".join(lines)
+
+
+async def run_loadtest(
+    base_url: str | Sequence[str],
+    credentials: Sequence[tuple[str, str]],
+    mix: Mapping[str, float],
+    *,
+    duration: float,
+    rps: float | None = None,
+    concurrency: int | None = None,
+    max_in_flight: int = 1000,
+    transport: httpx.AsyncBaseTransport | None = None,
+    seed: int | None = None,
+    client_options: Mapping[str, Any] | None = None,
+) -> LoadTestReport:
+    """Run a load test and return its report.
+
+    Exactly one of ``rps`` (open loop: requests are started on schedule, and
+    skipped as ``dropped`` once ``max_in_flight`` are outstanding) or
+    ``concurrency`` (closed loop: that many workers issue requests back to
+    back) must be given.
+    """
+    if (rps is None) == (concurrency is None):
+        raise UbillingError("Specify exactly one of rps or concurrency")
+    if rps is not None and rps <= 0:
+        raise UbillingError("rps must be greater than 0")
+    if concurrency is not None and concurrency < 1:
+        raise UbillingError("concurrency must be at least 1")
+    if duration <= 0:
+        raise UbillingError("duration must be greater than 0")
+    if max_in_flight < 1:
+        raise UbillingError("max_in_flight must be at least 1")
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    report = LoadTestReport()
+    limits = httpx.Limits(max_connections=concurrency or max_in_flight)
+    tap = _TapTransport(transport or httpx.AsyncHTTPTransport(limits=limits), _on_exchange)
+
+    async with UbillingClient(base_url, transport=tap, **(client_options or {})) as client:
+
+        async def one_request() -> None:
+            endpoint = rng.choices(names, weights)[0]
+            login, password = rng.choice(credentials)
+            sample = _Sample()
+            _current_sample.set(sample)
+            error = None
+            started = time.monotonic()
+            try:
+                await getattr(client, ENDPOINTS[endpoint])(login, password)
+            except Exception as exc:
+                error = type(exc).__name__
+            report.add(endpoint, time.monotonic() - started, sample, error)
+
+        started = time.monotonic()
+        deadline = started + duration
+        if concurrency is not None:
+
+            async def worker() -> None:
+                while time.monotonic() < deadline:
+                    await one_request()
+
+            async with asyncio.TaskGroup() as group:
+                for _ in range(concurrency):
+                    group.create_task(worker())
+        else:
+            assert rps is not None
+            in_flight: set[asyncio.Task[None]] = set()
+            interval = 1.0 / rps
+            next_at = started
+            while next_at < deadline:
+                await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+                next_at += interval
+                if len(in_flight) >= max_in_flight:
+                    report.dropped += 1
+                    continue
+                task = asyncio.create_task(one_request())
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.wait(in_flight)
+        report.duration = time.monotonic() - started
+    return report
@@ -0,0 +1,251 @@
+"""Shared clients for several Ubilling installations.
+
+:class:`ClientManager` creates one :class:`~pyubilling.client.UbillingClient`
+per installation on first use and reuses it. All clients share one
+connection pool and one in-flight request limit, which is divided between
+installations by weighted fair queuing, and clients that stay idle are
+closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+import httpx
+
+from pyubilling._scheduler import _FairScheduler
+from pyubilling.client import UbillingClient
+from pyubilling.exceptions import UbillingError
+
+
+@dataclass(frozen=True, slots=True)
+class InstallationStats:
+    """Usage statistics of one installation. Latencies are in seconds."""
+
+    name: str
+    open: bool
+    leases: int
+    requests: int
+    failed: int
+    errors: dict[str, int]
+    total_latency: float
+    max_latency: float
+    queued: int
+    in_flight: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed / self.requests if self.requests else 0.0
+
+
+@dataclass(slots=True)
+class _Installation:
+    options: dict[str, Any]
+    client: UbillingClient | None = None
+    leases: int = 0
+    last_used: float = 0.0
+    requests: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Lets clients share a transport without closing it when they close."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class ClientManager:
+    """Lazily created, shared clients for several installations.
+
+    ``installations`` maps a name to :class:`~pyubilling.client.UbillingClient`
+    keyword arguments, at least ``base_url`` (more can be added with
+    :meth:`register`). Clients are opened on first :meth:`use` and closed
+    after ``idle_timeout`` seconds without use.
+
+    All clients send through one connection pool of at most
+    ``max_connections`` sockets (default: ``max_in_flight``), so the cap
+    holds across installations. At most ``max_in_flight`` requests run at
+    once; when they are exhausted, waiting installations are admitted in
+    proportion to ``weights`` (default 1 each), so a busy installation cannot
+    starve the others. Idle sockets of evicted clients are closed by the
+    pool after ``keepalive_expiry`` seconds.
+
+    Usage::
+
+        manager = ClientManager(
+            {
+                "north": {"base_url": "https://north.example.net/userstats", "uber_key": k1},
+                "south": {"base_url": "https://south.example.net/userstats"},
+            },
+            max_in_flight=50,
+        )
+        async with manager:
+            async with manager.use("north") as client:
+                user = await client.get_user_info(login, password)
+            print(manager.stats()["north"].mean_latency)
+    """
+
+    def __init__(
+        self,
+        installations: Mapping[str, Mapping[str, Any]] | None = None,
+        *,
+        max_in_flight: int = 100,
+        max_connections: int | None = None,
+        keepalive_expiry: float = 5.0,
+        weights: Mapping[str, float] | None = None,
+        idle_timeout: float = 300.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._scheduler: _FairScheduler[str] = _FairScheduler(max_in_flight, weights)
+        self._idle_timeout = idle_timeout
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections or max_in_flight,
+                    keepalive_expiry=keepalive_expiry,
+                )
+            )
+        self._transport = transport
+        self._installations: dict[str, _Installation] = {}
+        self._lock = asyncio.Lock()
+        self._last_eviction = time.monotonic()
+        for name, options in (installations or {}).items():
+            self.register(name, **options)
+
+    def register(self, name: str, base_url: str | Sequence[str], **options: Any) -> None:
+        """Add an installation; ``options`` are passed to its client."""
+        if name in self._installations:
+            raise UbillingError(f"Installation {name!r} is already registered")
+        if "transport" in options:
+            raise UbillingError("Clients of a ClientManager use the manager's transport")
+        UbillingClient(base_url, **options)  # validate the options early
+        self._installations[name] = _Installation({"base_url": base_url, **options})
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._installations)
+
+    async def __aenter__(self) -> ClientManager:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every client and the shared connection pool."""
+        for installation in self._installations.values():
+            await self._close(installation)
+        await self._transport.aclose()
+
+    @asynccontextmanager
+    async def use(self, name: str) -> AsyncIterator[UbillingClient]:
+        """Borrow the client of installation ``name``, opening it if needed.
+
+        The client must not be used after the block ends; it may be closed
+        once it has been idle for ``idle_timeout`` seconds.
+        """
+        installation = self._installations.get(name)
+        if installation is None:
+            raise UbillingError(f"Unknown installation: {name!r}")
+        await self._evict_due()
+        installation.leases += 1
+        try:
+            yield await self._open(name, installation)
+        finally:
+            installation.leases -= 1
+            installation.last_used = time.monotonic()
+
+    async def evict_idle(self) -> int:
+        """Close clients idle for ``idle_timeout`` seconds; return how many."""
+        self._last_eviction = now = time.monotonic()
+        evicted = 0
+        for installation in self._installations.values():
+            if (
+                installation.client is not None
+                and installation.leases == 0
+                and now - installation.last_used >= self._idle_timeout
+            ):
+                await self._close(installation)
+                evicted += 1
+        return evicted
+
+    def stats(self) -> dict[str, InstallationStats]:
+        """Return latency, error and queueing statistics per installation."""
+        queues = self._scheduler.stats()
+        result = {}
+        for name, installation in self._installations.items():
+            queue = queues.get(name)
+            result[name] = InstallationStats(
+                name=name,
+                open=installation.client is not None,
+                leases=installation.leases,
+                requests=installation.requests,
+                failed=installation.errors.total(),
+                errors=dict(installation.errors),
+                total_latency=installation.total_latency,
+                max_latency=installation.max_latency,
+                queued=queue.queued if queue else 0,
+                in_flight=queue.in_flight if queue else 0,
+                total_wait=queue.total_wait if queue else 0.0,
+                max_wait=queue.max_wait if queue else 0.0,
+            )
+        return result
+
+    async def _open(self, name: str, installation: _Installation) -> UbillingClient:
+        if installation.client is not None:
+            return installation.client
+        async with self._lock:
+            if installation.client is None:
+                client = UbillingClient(
+                    **installation.options, transport=_SharedTransport(self._transport)
+                )
+                client._limiter = partial(self._slot, name)
+                installation.client = await client.__aenter__()
+            return installation.client
+
+    async def _close(self, installation: _Installation) -> None:
+        client, installation.client = installation.client, None
+        if client is not None:
+            await client.close()
+
+    async def _evict_due(self) -> None:
+        if time.monotonic() - self._last_eviction >= self._idle_timeout / 2:
+            await self.evict_idle()
+
+    @asynccontextmanager
+    async def _slot(self, name: str) -> AsyncIterator[None]:
+        installation = self._installations[name]
+        async with self._scheduler.slot(name):
+            started = time.monotonic()
+            try:
+                yield
+            except Exception as exc:
+                installation.errors[type(exc).__name__] += 1
+                raise
+            finally:
+                elapsed = time.monotonic() - started
+                installation.requests += 1
+                installation.total_latency += elapsed
+                installation.max_latency = max(installation.max_latency, elapsed)
@@ -0,0 +1,351 @@
+"""Traffic recording and replay for offline load testing.
+
+A client created with ``record_to=path`` appends every XMLAgent exchange to a
+gzip-compressed JSON-lines archive, with ``uberpassword`` and ``uberkey``
+redacted. :class:`ReplayTransport` serves such an archive locally, so the
+client's parse and concurrency paths can be benchmarked against real
+response shapes without a network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import base64
+import gzip
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+import httpx
+
+from pyubilling._endpoints import Endpoint
+from pyubilling.exceptions import UbillingError
+
+_FORMAT = "pyubilling-traffic"
+_VERSION = 1
+_REDACTED = "***"
+# Records buffered before they are appended to the archive as one gzip member.
+_FLUSH_EVERY = 32
+_SECRET_PARAMS = frozenset({"uberpassword", "uberkey"})
+# Bodies are stored decoded, so transfer-level headers no longer apply.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficRecord:
+    """One recorded request/response exchange."""
+
+    endpoint: str
+    method: str
+    params: dict[str, str]
+    status_code: int
+    headers: list[tuple[str, str]]
+    elapsed: float
+    body: bytes
+
+    @property
+    def login(self) -> str:
+        return self.params.get("uberlogin", "")
+
+    def to_json(self) -> str:
+        data = {
+            "endpoint": self.endpoint,
+            "method": self.method,
+            "params": self.params,
+            "status": self.status_code,
+            "headers": self.headers,
+            "elapsed": round(self.elapsed, 6),
+        }
+        try:
+            data["body"] = self.body.decode()
+        except UnicodeDecodeError:
+            data["body_b64"] = base64.b64encode(self.body).decode()
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> TrafficRecord:
+        data = json.loads(line)
+        if "body_b64" in data:
+            body = base64.b64decode(data["body_b64"])
+        else:
+            body = data.get("body", "").encode()
+        return cls(
+            endpoint=data["endpoint"],
+            method=data["method"],
+            params=data["params"],
+            status_code=data["status"],
+            headers=[(name, value) for name, value in data["headers"]],
+            elapsed=data["elapsed"],
+            body=body,
+        )
+
+
+def read_traffic(path: str | os.PathLike[str]) -> Iterator[TrafficRecord]:
+    """Iterate over the records of a traffic archive.
+
+    Archives of processes that exited without closing their writer lack the
+    gzip trailer and may end in a partly written record; they are read up to
+    the last complete record. Damaged archives raise :class:`UbillingError`.
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for number, line in enumerate(archive, 1):
+                if not line.endswith("\n"):
+                    break
+                if not line.strip() or line.startswith('{"format"'):
+                    continue
+                try:
+                    record = TrafficRecord.from_json(line)
+                except (ValueError, KeyError, TypeError) as exc:
+                    raise UbillingError(f"{path}:{number}: invalid traffic record: {exc}") from exc
+                yield record
+    except EOFError:
+        pass
+    except (gzip.BadGzipFile, zlib.error, UnicodeDecodeError) as exc:
+        raise UbillingError(f"{path}: damaged traffic archive: {exc}") from exc
+
+
+type _ExchangeCallback = Callable[[httpx.Request, httpx.Response, bytes, float], None]
+
+
+class _TapTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
+    """Wraps a transport and reports every exchange to ``on_exchange``.
+
+    The response body is read in full so the reported time covers the
+    download. The callback receives the raw (still content-encoded) body.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | httpx.BaseTransport,
+        on_exchange: _ExchangeCallback,
+    ) -> None:
+        self._transport = transport
+        self._on_exchange = on_exchange
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(self._transport, httpx.AsyncBaseTransport)
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        try:
+            assert isinstance(response.stream, httpx.AsyncByteStream)
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        self._on_exchange(request, response, raw, time.monotonic() - started)
+        return _rebuild(response, raw)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(self._transport, httpx.BaseTransport)
+        started = time.monotonic()
+        response = self._transport.handle_request(request)
+        try:
+            assert isinstance(response.stream, httpx.SyncByteStream)
+            raw = b"".join(response.stream)
+        finally:
+            response.close()
+        self._on_exchange(request, response, raw, time.monotonic() - started)
+        return _rebuild(response, raw)
+
+    async def aclose(self) -> None:
+        assert isinstance(self._transport, httpx.AsyncBaseTransport)
+        await self._transport.aclose()
+
+    def close(self) -> None:
+        assert isinstance(self._transport, httpx.BaseTransport)
+        self._transport.close()
+
+
+def _rebuild(response: httpx.Response, raw: bytes) -> httpx.Response:
+    return httpx.Response(
+        response.status_code,
+        headers=response.headers,
+        stream=httpx.ByteStream(raw),
+        extensions=response.extensions,
+    )
+
+
+def _redact(params: Iterable[tuple[str, str]]) -> dict[str, str]:
+    return {
+        key: _REDACTED if key in _SECRET_PARAMS else value for key, value in params
+    }
+
+
+def _record(
+    request: httpx.Request, response: httpx.Response, raw: bytes, elapsed: float
+) -> TrafficRecord:
+    params = _redact(request.url.params.multi_items())
+    body = httpx.Response(
+        response.status_code, headers=response.headers, stream=httpx.ByteStream(raw)
+    ).read()
+    return TrafficRecord(
+        endpoint=Endpoint.name_of(params),
+        method=request.method,
+        params=params,
+        status_code=response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        ],
+        elapsed=elapsed,
+        body=body,
+    )
+
+
+class _TrafficWriter:
+    """Appends records to a gzip JSON-lines archive; safe to share between threads.
+
+    Records are buffered and appended as one complete gzip member, with a
+    single write, every ``_FLUSH_EVERY`` records and when the writer is
+    closed, garbage collected or left open at interpreter exit. A killed
+    process loses only its buffered records and leaves a readable archive.
+    Processes sharing the archive after a fork never interleave partial
+    members; a forked child drops the parent's buffered records, which the
+    parent writes itself.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        self._lock = threading.Lock()
+        self._buffer = [json.dumps({"format": _FORMAT, "version": _VERSION}) + "\n"]
+        self._flush()
+        _writers.add(self)
+
+    _fd = -1
+
+    def __del__(self) -> None:
+        self.close()
+
+    def tap(self, transport: httpx.AsyncBaseTransport | httpx.BaseTransport) -> _TapTransport:
+        """Wrap ``transport`` so that its exchanges are written to the archive."""
+        return _TapTransport(transport, self._on_exchange)
+
+    def _on_exchange(
+        self, request: httpx.Request, response: httpx.Response, raw: bytes, elapsed: float
+    ) -> None:
+        line = _record(request, response, raw, elapsed).to_json() + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= _FLUSH_EVERY:
+                self._flush()
+
+    def _flush(self) -> None:
+        data = gzip.compress("".join(self._buffer).encode(), mtime=0)
+        self._buffer.clear()
+        while data:
+            data = data[os.write(self._fd, data) :]
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        with self._lock:
+            if self._fd < 0:
+                return
+            if self._buffer:
+                self._flush()
+            os.close(self._fd)
+            self._fd = -1
+
+    def _after_fork(self) -> None:
+        # Another thread may have held the lock at fork time.
+        self._lock = threading.Lock()
+        self._buffer = []
+
+
+# Open writers, closed at exit and reset in forked children.
+_writers: weakref.WeakSet[_TrafficWriter] = weakref.WeakSet()
+
+
+def _close_writers() -> None:
+    for writer in list(_writers):
+        writer.close()
+
+
+def _reset_writers() -> None:
+    for writer in list(_writers):
+        writer._after_fork()
+
+
+atexit.register(_close_writers)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_writers)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
+    """Serves recorded traffic locally instead of contacting the server.
+
+    Each request is answered with a recorded response for the same logical
+    endpoint, preferring records of the same login and cycling through them
+    in order. Responses are delayed by the recorded time multiplied by
+    ``latency_scale`` (``0`` disables the delay). Requests for endpoints that
+    were never recorded get a 404 response.
+
+    Works with both clients::
+
+        transport = ReplayTransport.from_archive("traffic.jsonl.gz", latency_scale=0.5)
+        async with UbillingClient(url, transport=transport) as client:
+            ...
+    """
+
+    def __init__(self, records: Iterable[TrafficRecord], *, latency_scale: float = 1.0) -> None:
+        grouped: dict[tuple[str, ...], list[TrafficRecord]] = {}
+        for record in records:
+            grouped.setdefault((record.method, record.endpoint), []).append(record)
+            grouped.setdefault((record.method, record.endpoint, record.login), []).append(record)
+        if not grouped:
+            raise UbillingError("No traffic records to replay")
+        self._cycles = {key: itertools.cycle(group) for key, group in grouped.items()}
+        self._latency_scale = latency_scale
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_archive(
+        cls, path: str | os.PathLike[str], *, latency_scale: float = 1.0
+    ) -> ReplayTransport:
+        return cls(read_traffic(path), latency_scale=latency_scale)
+
+    def _lookup(self, request: httpx.Request) -> tuple[str, TrafficRecord | None]:
+        params = dict(request.url.params.multi_items())
+        endpoint = Endpoint.name_of(params)
+        login = params.get("uberlogin", "")
+        cycle = self._cycles.get((request.method, endpoint, login)) or self._cycles.get(
+            (request.method, endpoint)
+        )
+        if cycle is None:
+            return endpoint, None
+        with self._lock:
+            return endpoint, next(cycle)
+
+    @staticmethod
+    def _respond(
+        request: httpx.Request, endpoint: str, record: TrafficRecord | None
+    ) -> httpx.Response:
+        if record is None:
+            return httpx.Response(
+                404, text=f"No recorded traffic for endpoint {endpoint!r}", request=request
+            )
+        return httpx.Response(
+            record.status_code, headers=record.headers, content=record.body, request=request
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint, record = self._lookup(request)
+        if record is not None and self._latency_scale > 0:
+            await asyncio.sleep(record.elapsed * self._latency_scale)
+        return self._respond(request, endpoint, record)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint, record = self._lookup(request)
+        if record is not None and self._latency_scale > 0:
+            time.sleep(record.elapsed * self._latency_scale)
+        return self._respond(request, endpoint, record)
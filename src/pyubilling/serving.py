@@ -0,0 +1,202 @@
+"""Stale-if-error and refresh-ahead serving of subscriber reads.
+
+:class:`ServingCache` sits in front of a
+:class:`~pyubilling.client.UbillingClient` and keeps the last successful
+result of each read per subscriber. Hot entries are refreshed in the
+background shortly before they expire, and while the billing server is
+unreachable or failing the last good result is served with its age instead
+of an error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from pyubilling._authcache import credential_key
+from pyubilling.client import _READ_METHODS, UbillingClient
+from pyubilling.exceptions import (
+    UbillingConnectionError,
+    UbillingError,
+    UbillingResponseError,
+)
+from pyubilling.models import AgentData, FreezeData, TariffVService, UserInfo
+
+logger = logging.getLogger("pyubilling")
+
+# check_auth results have their own cache in the client.
+_CACHEABLE_METHODS = _READ_METHODS - {"check_auth"}
+
+type _Key = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Served[T]:
+    """A result returned by :class:`ServingCache`.
+
+    ``stale`` results come from an earlier successful call because the
+    current one failed or was too slow; ``error`` says why. ``age`` is the
+    number of seconds since the value was fetched.
+    """
+
+    value: T
+    stale: bool = False
+    age: float = 0.0
+    error: UbillingError | None = None
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    fetched_at: float
+
+
+def _is_transient(exc: UbillingError) -> bool:
+    """Whether an error is an upstream outage that a stale result may cover."""
+    if isinstance(exc, UbillingResponseError):
+        return exc.status_code >= 500
+    return isinstance(exc, UbillingConnectionError)
+
+
+class ServingCache:
+    """Serve subscriber reads from memory, refreshing ahead and falling back to stale data.
+
+    Results are fresh for ``ttl`` seconds. A read of an entry older than
+    ``refresh_ahead * ttl`` returns it immediately and starts a background
+    refresh, so frequently read subscribers rarely wait on the network.
+    Expired entries are refetched; if that fails with a connection error or
+    an HTTP 5xx, the previous result is returned as stale for up to
+    ``max_stale`` seconds after it was fetched. With ``stale_after``, a
+    refetch that takes longer than that many seconds is answered with the
+    stale result too, while the request keeps running to refresh the entry.
+
+    Other errors (bad credentials, parse errors) drop the entry and are
+    raised. Concurrent reads of the same entry share one request. Entries
+    are keyed by method, login and a hash of the password.
+
+    Usage::
+
+        async with UbillingClient(url) as client, ServingCache(client, ttl=60) as cache:
+            served = await cache.get_user_info(login, password)
+            if served.stale:
+                show_banner(f"Data from {served.age:.0f}s ago")
+            render(served.value)
+    """
+
+    def __init__(
+        self,
+        client: UbillingClient,
+        *,
+        ttl: float = 30.0,
+        refresh_ahead: float = 0.8,
+        max_stale: float = 3600.0,
+        stale_after: float | None = None,
+        maxsize: int = 10_000,
+    ) -> None:
+        if not 0 < refresh_ahead <= 1:
+            raise UbillingError("refresh_ahead must be in (0, 1]")
+        self._client = client
+        self._ttl = ttl
+        self._refresh_ahead = refresh_ahead
+        self._max_stale = max_stale
+        self._stale_after = stale_after
+        self._maxsize = maxsize
+        self._entries: dict[_Key, _Entry] = {}
+        self._pending: dict[_Key, asyncio.Future[Any]] = {}
+
+    async def __aenter__(self) -> ServingCache:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancel background refreshes."""
+        pending = list(self._pending.values())
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def invalidate(self, login: str) -> None:
+        """Drop every cached result of ``login``, e.g. after a write."""
+        for key in [key for key in self._entries if key[1] == login]:
+            del self._entries[key]
+
+    async def get(self, method: str, login: str, password: str) -> Served[Any]:
+        """Call the client's read ``method`` for a subscriber through the cache."""
+        if method not in _CACHEABLE_METHODS:
+            raise UbillingError(f"Not a cacheable read method: {method!r}")
+        key = (method, login, credential_key(login, password))
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self._ttl:
+                if age >= self._ttl * self._refresh_ahead:
+                    self._refresh(key, login, password)
+                return Served(entry.value, age=age)
+
+        pending = self._refresh(key, login, password)
+        try:
+            if entry is not None and self._stale_after is not None:
+                value = await asyncio.wait_for(asyncio.shield(pending), self._stale_after)
+            else:
+                value = await asyncio.shield(pending)
+        except TimeoutError:
+            error = UbillingConnectionError(f"No response within {self._stale_after}s")
+            return self._serve_stale(entry, error)
+        except UbillingError as exc:
+            if entry is None or not _is_transient(exc):
+                raise
+            return self._serve_stale(entry, exc)
+        return Served(value)
+
+    async def get_user_info(self, login: str, password: str) -> Served[UserInfo | None]:
+        return await self.get("get_user_info", login, password)
+
+    async def get_tariff_vservices(
+        self, login: str, password: str
+    ) -> Served[list[TariffVService]]:
+        return await self.get("get_tariff_vservices", login, password)
+
+    async def get_freeze_data(self, login: str, password: str) -> Served[FreezeData | None]:
+        return await self.get("get_freeze_data", login, password)
+
+    async def get_agent_data(self, login: str, password: str) -> Served[AgentData | None]:
+        return await self.get("get_agent_data", login, password)
+
+    def _serve_stale(self, entry: _Entry, error: UbillingError) -> Served[Any]:
+        age = time.monotonic() - entry.fetched_at
+        if age > self._max_stale:
+            raise error
+        return Served(entry.value, stale=True, age=age, error=error)
+
+    def _refresh(self, key: _Key, login: str, password: str) -> asyncio.Future[Any]:
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(key, login, password))
+            self._pending[key] = pending
+            pending.add_done_callback(partial(self._on_done, key))
+        return pending
+
+    async def _fetch(self, key: _Key, login: str, password: str) -> Any:
+        try:
+            value = await getattr(self._client, key[0])(login, password)
+        except UbillingError as exc:
+            if not _is_transient(exc):
+                self._entries.pop(key, None)
+            raise
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = _Entry(value, time.monotonic())
+        return value
+
+    def _on_done(self, key: _Key, future: asyncio.Future[Any]) -> None:
+        self._pending.pop(key, None)
+        # Background refreshes have no awaiter; consume their errors here.
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            logger.debug("Refresh of %s for %s failed: %s", key[0], key[1], exc)
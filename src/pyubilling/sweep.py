@@ -0,0 +1,244 @@
+"""Multi-process sweeps over many subscriber credentials.
+
+A single event loop spends most of a large sweep parsing and validating
+responses, which is bound to one core. :class:`ShardedSweep` splits the
+credential list across worker processes, each running its own
+:class:`~pyubilling.client.UbillingClient` and connection pool, and streams
+the results back to the parent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyubilling.client import _READ_METHODS, UbillingClient
+from pyubilling.exceptions import UbillingError
+
+_POLL_INTERVAL = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """Outcome of one API call made during a sweep."""
+
+    login: str
+    value: Any = None
+    error: str | None = None
+    message: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class SweepProgress:
+    """Aggregated progress across all sweep workers."""
+
+    total: int
+    done: int
+    failed: int
+    elapsed: float
+    errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second since the sweep started."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ShardedSweep:
+    """Run one client method for many logins across several processes.
+
+    Credentials are sharded round-robin over ``processes`` workers (default:
+    the CPU count). Every worker opens its own client with ``client_options``
+    and keeps at most ``concurrency`` requests in flight. Results are sent to
+    the parent in batches of ``batch_size`` and yielded in completion order.
+    Per-login errors are reported as results; a worker that fails as a whole
+    raises :class:`~pyubilling.exceptions.UbillingError` in the parent.
+
+    Workers are started with the ``spawn`` method, so scripts must iterate
+    the sweep under an ``if __name__ == "__main__":`` guard.
+
+    Usage::
+
+        sweep = ShardedSweep(
+            "http://billing.example.com/userstats",
+            credentials,
+            method="get_user_info",
+            processes=4,
+            concurrency=20,
+            client_options={"timeout": 10.0},
+        )
+        for result in sweep:
+            if result.ok:
+                store(result.login, result.value)
+        print(sweep.progress.throughput, sweep.progress.errors)
+    """
+
+    def __init__(
+        self,
+        base_url: str | Sequence[str],
+        credentials: Iterable[tuple[str, str]],
+        *,
+        method: str = "get_user_info",
+        processes: int | None = None,
+        concurrency: int = 20,
+        batch_size: int = 100,
+        client_options: dict[str, Any] | None = None,
+        on_progress: Callable[[SweepProgress], None] | None = None,
+    ) -> None:
+        if method not in _READ_METHODS:
+            raise UbillingError(
+                f"Not a (login, password) read method: {method!r}; "
+                f"choose from {', '.join(sorted(_READ_METHODS))}"
+            )
+        self._base_url = base_url
+        self._credentials = list(credentials)
+        self._method = method
+        self._processes = max(1, min(processes or os.cpu_count() or 1, len(self._credentials)))
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._client_options = client_options or {}
+        self._on_progress = on_progress
+        self._done = 0
+        self._errors: Counter[str] = Counter()
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    @property
+    def progress(self) -> SweepProgress:
+        elapsed = 0.0
+        if self._started is not None:
+            elapsed = (self._finished or time.monotonic()) - self._started
+        return SweepProgress(
+            total=len(self._credentials),
+            done=self._done,
+            failed=self._errors.total(),
+            elapsed=elapsed,
+            errors=dict(self._errors),
+        )
+
+    def __iter__(self) -> Iterator[SweepResult]:
+        if not self._credentials:
+            return
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        workers = [
+            ctx.Process(
+                target=_run_worker,
+                args=(
+                    self._base_url,
+                    self._client_options,
+                    self._method,
+                    self._credentials[shard :: self._processes],
+                    self._concurrency,
+                    self._batch_size,
+                    results,
+                ),
+                daemon=True,
+            )
+            for shard in range(self._processes)
+        ]
+        self._started = time.monotonic()
+        self._finished = None
+        for worker in workers:
+            worker.start()
+        try:
+            running = len(workers)
+            while running:
+                try:
+                    batch = results.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    self._check_workers(workers)
+                    continue
+                if batch is None:
+                    running -= 1
+                    continue
+                if isinstance(batch, str):
+                    raise UbillingError(f"Sweep worker failed: {batch}")
+                for result in batch:
+                    self._done += 1
+                    if result.error is not None:
+                        self._errors[result.error] += 1
+                    yield result
+                if self._on_progress is not None:
+                    self._on_progress(self.progress)
+        finally:
+            self._finished = time.monotonic()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            results.close()
+
+    @staticmethod
+    def _check_workers(workers: list[multiprocessing.process.BaseProcess]) -> None:
+        for worker in workers:
+            if worker.exitcode not in (None, 0):
+                raise UbillingError(
+                    f"Sweep worker {worker.pid} exited with code {worker.exitcode}"
+                )
+
+
+def _run_worker(
+    base_url: str | Sequence[str],
+    client_options: dict[str, Any],
+    method: str,
+    credentials: list[tuple[str, str]],
+    concurrency: int,
+    batch_size: int,
+    results: multiprocessing.Queue,
+) -> None:
+    try:
+        asyncio.run(
+            _sweep_shard(
+                base_url, client_options, method, credentials, concurrency, batch_size, results
+            )
+        )
+    except BaseException as exc:
+        results.put(f"{type(exc).__name__}: {exc}")
+        raise
+    results.put(None)
+
+
+async def _sweep_shard(
+    base_url: str | Sequence[str],
+    client_options: dict[str, Any],
+    method: str,
+    credentials: list[tuple[str, str]],
+    concurrency: int,
+    batch_size: int,
+    results: multiprocessing.Queue,
+) -> None:
+    pending = iter(credentials)
+    batch: list[SweepResult] = []
+
+    async def consume(client: UbillingClient) -> None:
+        call = getattr(client, method)
+        for login, password in pending:
+            try:
+                result = SweepResult(login, await call(login, password))
+            except Exception as exc:
+                result = SweepResult(login, error=type(exc).__name__, message=str(exc))
+            batch.append(result)
+            if len(batch) >= batch_size:
+                results.put(batch.copy())
+                batch.clear()
+
+    async with (
+        UbillingClient(base_url, **client_options) as client,
+        asyncio.TaskGroup() as group,
+    ):
+        for _ in range(concurrency):
+            group.create_task(consume(client))
+    if batch:
+        results.put(batch)
@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Sequence
+
+import httpx
+
+from pyubilling._balancer import Strategy
+from pyubilling._base import _BaseClient
+from pyubilling._endpoints import Endpoint
+from pyubilling._parsers import parse_list, parse_single
+from pyubilling.exceptions import UbillingError, UbillingResponseError
+from pyubilling.models import (
+    AgentData,
+    AllowedTariff,
+    Announcement,
+    CreditInfo,
+    FeeCharge,
+    FreezeData,
+    FreezeResult,
+    PayCardResult,
+    Payment,
+    PaymentSystem,
+    TariffVService,
+    Ticket,
+    TicketCreateResult,
+    UserInfo,
+)
+from pyubilling.recording import _TrafficWriter
+
+logger = logging.getLogger("pyubilling")
+
+
+class UbillingSyncClient(_BaseClient):
+    """Synchronous client for Ubilling XMLAgent API.
+
+    Mirrors the methods of :class:`~pyubilling.client.UbillingClient` for
+    thread-based WSGI applications. One long-lived, thread-safe
+    ``httpx.Client`` pool is opened in the constructor and shared by all
+    threads, so connections are reused across requests. Create one instance
+    per process and call :meth:`close` on shutdown.
+
+    Multiple ``base_url`` values, ``compact`` parsing, ``transport`` and
+    ``record_to`` work exactly as in the async client. Priority lanes and
+    the ``check_auth`` cache are async-only.
+
+    Usage::
+
+        client = UbillingSyncClient(
+            "http://demo.ubilling.net.ua:9999/billing/userstats",
+            max_connections=50,
+        )
+        user = client.get_user_info(login="john", password="md5_hash_of_password")
+    """
+
+    def __init__(
+        self,
+        base_url: str | Sequence[str],
+        *,
+        timeout: float = 5.0,
+        uber_key: str | None = None,
+        strategy: Strategy = "least_outstanding",
+        max_failures: int = 3,
+        eject_time: float = 10.0,
+        compact: bool = False,
+        max_connections: int = 100,
+        transport: httpx.BaseTransport | None = None,
+        record_to: str | os.PathLike[str] | None = None,
+    ) -> None:
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            uber_key=uber_key,
+            strategy=strategy,
+            max_failures=max_failures,
+            eject_time=eject_time,
+            compact=compact,
+        )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._recorder: _TrafficWriter | None = None
+        if record_to is not None:
+            self._recorder = _TrafficWriter(record_to)
+            transport = self._recorder.tap(transport or httpx.HTTPTransport(limits=limits))
+        self._client: httpx.Client | None = httpx.Client(
+            timeout=timeout, limits=limits, transport=transport
+        )
+
+    def __enter__(self) -> UbillingSyncClient:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _ensure_client(self) -> httpx.Client:
+        if self._client is None:
+            raise UbillingError("Client is closed")
+        return self._client
+
+    def _send(
+        self, url: str, method: str, params: dict[str, str], body: dict | None
+    ) -> httpx.Response:
+        client = self._ensure_client()
+        try:
+            response = client.request(method, url, params=params, json=body)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise self._map_http_error(exc) from exc
+        return response
+
+    def _request(
+        self,
+        method: str,
+        params: dict[str, str],
+        body: dict | None = None,
+        *,
+        idempotent: bool,
+    ) -> bytes:
+        """Send a request, retrying on other nodes as described in :meth:`_attempts`."""
+        self._ensure_client()
+        params = self._inject_uber_key(params)
+        for attempt in self._attempts(method, idempotent=idempotent):
+            with attempt:
+                response = self._send(attempt.node.url, method, params, body)
+                logger.debug("%s %s -> %d bytes", method, response.url, len(response.content))
+                return response.content
+        raise AssertionError("unreachable")
+
+    def _get(self, params: dict[str, str], *, idempotent: bool = True) -> bytes:
+        return self._request("GET", params, idempotent=idempotent)
+
+    def _post(self, params: dict[str, str], body: dict) -> bytes:
+        return self._request("POST", params, body, idempotent=False)
+
+    # -- User data --
+
+    def get_user_info(self, login: str, password: str) -> UserInfo | None:
+        """Get user account information.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.user_info(login, password))
+        return parse_single(raw, UserInfo, root_tag="userdata", compact=self._compact)
+
+    def check_auth(self, login: str, password: str) -> bool:
+        """Check if credentials are valid without returning user data.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        try:
+            self._get(Endpoint.just_auth(login, password))
+            return True
+        except UbillingResponseError:
+            return False
+
+    # -- Payments & charges --
+
+    def get_payments(self, login: str, password: str) -> list[Payment]:
+        """Get user payment history.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.payments(login, password))
+        return parse_list(raw, Payment, root_tag="payment", compact=self._compact)
+
+    def get_fee_charges(
+        self,
+        login: str,
+        password: str,
+        *,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> list[FeeCharge]:
+        """Get fee charge (debit) history.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+            date_from: Optional start date filter (YYYY-MM-DD).
+            date_to: Optional end date filter (YYYY-MM-DD).
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(
+            Endpoint.fee_charges(login, password, date_from=date_from, date_to=date_to)
+        )
+        return parse_list(raw, FeeCharge, root_tag="feecharge", compact=self._compact)
+
+    # -- Announcements --
+
+    def get_announcements(self, login: str, password: str) -> list[Announcement]:
+        """Get active announcements for the user.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.announcements(login, password))
+        return parse_list(raw, Announcement, root_tag="data", compact=self._compact)
+
+    def mark_announcements_read(self, login: str, password: str) -> None:
+        """Mark all user announcements as read.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        self._get(
+            Endpoint.announcements_read_all(login, password), idempotent=False
+        )
+
+    # -- Tickets --
+
+    def get_tickets(self, login: str, password: str) -> list[Ticket]:
+        """Get all user support tickets and replies.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.tickets(login, password))
+        return parse_list(raw, Ticket, root_tag="ticket", compact=self._compact)
+
+    def create_ticket(
+        self,
+        login: str,
+        password: str,
+        text: str,
+        *,
+        reply_id: int | None = None,
+    ) -> TicketCreateResult | None:
+        """Create a support ticket or reply to an existing one.
+
+        The text is automatically BASE64-encoded before sending.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+            text: Ticket text (plaintext, will be base64-encoded).
+            reply_id: If replying, the ID of the original ticket (not a reply).
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(
+            Endpoint.ticket_create(login, password, text, reply_id=reply_id),
+            idempotent=False,
+        )
+        return parse_single(raw, TicketCreateResult, root_tag="data", compact=self._compact)
+
+    def create_signup_request(
+        self,
+        login: str,
+        password: str,
+        *,
+        date: str,
+        ip: str,
+        street: str,
+        build: str,
+        apt: str,
+        realname: str,
+        phone: str,
+        notes: str = "",
+    ) -> TicketCreateResult | None:
+        """Create a signup (connection) request via POST.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+            date: Request date (YYYY-MM-DD HH:MM:SS).
+            ip: Application IP address.
+            street: City and street.
+            build: Building number.
+            apt: Apartment number.
+            realname: Full name.
+            phone: Phone number.
+            notes: Additional notes.
+        """
+        self._validate_credentials(login, password)
+        body = {
+            "date": date,
+            "state": 0,
+            "ip": ip,
+            "street": street,
+            "build": build,
+            "apt": apt,
+            "realname": realname,
+            "phone": phone,
+            "service": "Internet",
+            "notes": notes,
+        }
+        raw = self._post(Endpoint.signup_request(login, password), body)
+        return parse_single(raw, TicketCreateResult, root_tag="data", compact=self._compact)
+
+    # -- Payment systems --
+
+    def get_payment_systems(self, login: str, password: str) -> list[PaymentSystem]:
+        """Get available online payment systems (OpenPayz).
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.payment_systems(login, password))
+        return parse_list(raw, PaymentSystem, root_tag="paysys", compact=self._compact)
+
+    # -- Credit --
+
+    def get_credit(self, login: str, password: str) -> CreditInfo | None:
+        """Request a credit for several days.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.credit(login, password), idempotent=False)
+        return parse_single(raw, CreditInfo, root_tag="data", compact=self._compact)
+
+    def check_credit(self, login: str, password: str) -> CreditInfo | None:
+        """Check if credit can be set (without actually setting it).
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.check_credit(login, password))
+        return parse_single(raw, CreditInfo, root_tag="data", compact=self._compact)
+
+    # -- Pay cards --
+
+    def use_pay_card(
+        self, login: str, password: str, card_number: str
+    ) -> PayCardResult | None:
+        """Activate a prepaid card to top up user balance.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+            card_number: Prepaid card number.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(
+            Endpoint.pay_card(login, password, card_number), idempotent=False
+        )
+        return parse_single(raw, PayCardResult, root_tag="data", compact=self._compact)
+
+    # -- Agent / contractor --
+
+    def get_agent_data(self, login: str, password: str) -> AgentData | None:
+        """Get contractor (agent) assigned to the user.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.agent_assigned(login, password))
+        return parse_single(raw, AgentData, root_tag="agentdata", compact=self._compact)
+
+    # -- Tariffs & virtual services --
+
+    def get_tariff_vservices(
+        self, login: str, password: str
+    ) -> list[TariffVService]:
+        """Get current user tariff and virtual services.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.tariff_vservices(login, password))
+        return parse_list(raw, TariffVService, root_tag="tariffvservices", compact=self._compact)
+
+    def get_allowed_tariffs(
+        self, login: str, password: str
+    ) -> list[AllowedTariff]:
+        """Get tariffs available for user to switch to.
+
+        Requires tariff switching to be enabled in userstats.ini.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.tariffs_to_switch(login, password))
+        return parse_list(
+            raw,
+            AllowedTariff,
+            root_tag="tarifftoswitchallowed",
+            compact=self._compact,
+        )
+
+    def get_active_tariffs_vservices(
+        self, login: str, password: str
+    ) -> list[TariffVService]:
+        """Get all active (non-archived) tariffs and virtual services.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.active_tariffs_vservices(login, password))
+        return parse_list(
+            raw,
+            TariffVService,
+            root_tag="activetariffsvservices",
+            compact=self._compact,
+        )
+
+    # -- Freeze / unfreeze --
+
+    def get_freeze_data(self, login: str, password: str) -> FreezeData | None:
+        """Get user freeze status and parameters.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.freeze_data(login, password))
+        return parse_single(raw, FreezeData, root_tag="freezedata", compact=self._compact)
+
+    def freeze_user(self, login: str, password: str) -> FreezeResult | None:
+        """Freeze the user account.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.do_freeze(login, password), idempotent=False)
+        return parse_single(raw, FreezeResult, root_tag="dofreeze", compact=self._compact)
+
+    def unfreeze_user(self, login: str, password: str) -> FreezeResult | None:
+        """Unfreeze the user account.
+
+        Requires XMLAGENT_SELF_UNFREEZE_ALLOWED to be enabled.
+
+        Args:
+            login: User login.
+            password: MD5 hash of user password.
+        """
+        self._validate_credentials(login, password)
+        raw = self._get(Endpoint.do_unfreeze(login, password), idempotent=False)
+        return parse_single(raw, FreezeResult, root_tag="dofreeze", compact=self._compact)
+
+    # -- Connection check --
+
+    def check_connection(self) -> bool:
+        """Verify that at least one API endpoint is reachable."""
+        client = self._ensure_client()
+        for url in self._base_urls:
+            try:
+                response = client.get(url)
+            except httpx.HTTPError:
+                continue
+            if response.is_success:
+                return True
+        return False
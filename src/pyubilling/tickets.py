@@ -0,0 +1,189 @@
+"""Incremental support ticket sync.
+
+``get_tickets`` always returns a subscriber's full ticket history as a flat
+list, with replies linked to their thread through ``reply_id``.
+:class:`TicketIndex` keeps that history grouped by thread and applies each
+new download as a diff, so callers only handle new or changed tickets and
+thread and "unanswered" lookups do not rescan the list.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from pyubilling.client import UbillingClient
+from pyubilling.models import Ticket
+
+# Ticket status of an open thread; closed threads have a non-zero status.
+_OPEN = 0
+
+
+def _thread_id(ticket: Ticket) -> int:
+    """Id of the thread a ticket belongs to; a ``reply_id`` of 0 means none."""
+    return ticket.reply_id or ticket.id
+
+
+def _insort(ids: list[int], value: int) -> None:
+    index = bisect.bisect_left(ids, value)
+    if index == len(ids) or ids[index] != value:
+        ids.insert(index, value)
+
+
+def _remove(ids: list[int], value: int) -> None:
+    index = bisect.bisect_left(ids, value)
+    if index < len(ids) and ids[index] == value:
+        del ids[index]
+
+
+@dataclass(frozen=True, slots=True)
+class TicketChanges:
+    """Difference between a ticket download and the previously indexed state."""
+
+    added: list[Ticket] = field(default_factory=list)
+    changed: list[Ticket] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class TicketIndex:
+    """Ticket history of one subscriber, indexed by thread.
+
+    A thread is a ticket without ``reply_id`` (or with ``reply_id`` 0) plus
+    every ticket replying to it. A thread is *unanswered* while it is open
+    and its latest message was written by the thread's author, i.e. the
+    subscriber is waiting for staff.
+    """
+
+    def __init__(self) -> None:
+        self._tickets: dict[int, Ticket] = {}
+        self._replies: dict[int, list[int]] = {}
+        # Sorted ids of unanswered threads.
+        self._unanswered: list[int] = []
+        self._max_id = 0
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._tickets
+
+    @property
+    def max_id(self) -> int:
+        """Highest ticket id seen so far."""
+        return self._max_id
+
+    def get(self, ticket_id: int) -> Ticket | None:
+        return self._tickets.get(ticket_id)
+
+    def replies(self, thread_id: int) -> list[Ticket]:
+        """Replies to a thread, oldest first."""
+        return [self._tickets[reply_id] for reply_id in self._replies.get(thread_id, ())]
+
+    def thread(self, thread_id: int) -> list[Ticket]:
+        """A thread's opening ticket followed by its replies; empty if unknown."""
+        root = self._tickets.get(thread_id)
+        if root is None:
+            return []
+        return [root, *self.replies(thread_id)]
+
+    def unanswered(self) -> list[Ticket]:
+        """Opening tickets of unanswered threads, oldest first."""
+        return [self._tickets[thread_id] for thread_id in self._unanswered]
+
+    def apply(self, tickets: Iterable[Ticket]) -> TicketChanges:
+        """Merge a full ``get_tickets`` result and return what changed.
+
+        Unknown ids are new; known tickets are compared with their indexed
+        version, so status or text edits show up as changes.
+        Indexed tickets missing from the download are reported as removed.
+        """
+        changes = TicketChanges()
+        touched: set[int] = set()
+        seen: set[int] = set()
+        for ticket in tickets:
+            seen.add(ticket.id)
+            previous = self._tickets.get(ticket.id)
+            if previous is None:
+                changes.added.append(ticket)
+            elif previous != ticket:
+                changes.changed.append(ticket)
+                self._unlink(previous)
+                touched.add(_thread_id(previous))
+            else:
+                continue
+            self._link(ticket)
+            touched.add(_thread_id(ticket))
+        if len(seen) < len(self._tickets):
+            for ticket_id in self._tickets.keys() - seen:
+                ticket = self._tickets[ticket_id]
+                self._unlink(ticket)
+                touched.add(_thread_id(ticket))
+                changes.removed.append(ticket_id)
+        for thread_id in touched:
+            self._refresh_unanswered(thread_id)
+        return changes
+
+    def _link(self, ticket: Ticket) -> None:
+        self._tickets[ticket.id] = ticket
+        self._max_id = max(self._max_id, ticket.id)
+        thread_id = _thread_id(ticket)
+        if thread_id != ticket.id:
+            _insort(self._replies.setdefault(thread_id, []), ticket.id)
+
+    def _unlink(self, ticket: Ticket) -> None:
+        del self._tickets[ticket.id]
+        thread_id = _thread_id(ticket)
+        if thread_id != ticket.id:
+            replies = self._replies.get(thread_id, [])
+            _remove(replies, ticket.id)
+            if not replies:
+                self._replies.pop(thread_id, None)
+
+    def _refresh_unanswered(self, thread_id: int) -> None:
+        root = self._tickets.get(thread_id)
+        replies = self._replies.get(thread_id)
+        latest = self._tickets[replies[-1]] if replies else root
+        if (
+            root is not None
+            and latest is not None
+            and root.status == _OPEN
+            and latest.from_user == root.from_user
+        ):
+            _insort(self._unanswered, thread_id)
+        else:
+            _remove(self._unanswered, thread_id)
+
+
+class TicketSync:
+    """Per-login :class:`TicketIndex` cache kept up to date from ``get_tickets``.
+
+    Usage::
+
+        sync = TicketSync()
+        changes = await sync.sync(client, login, password)
+        for ticket in changes.added:
+            notify(ticket)
+        waiting = sync.index(login).unanswered()
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[str, TicketIndex] = {}
+
+    def index(self, login: str) -> TicketIndex:
+        """The index for ``login``, empty if it has not been synced yet."""
+        index = self._indexes.get(login)
+        if index is None:
+            index = self._indexes[login] = TicketIndex()
+        return index
+
+    def forget(self, login: str) -> None:
+        self._indexes.pop(login, None)
+
+    async def sync(self, client: UbillingClient, login: str, password: str) -> TicketChanges:
+        """Download ``login``'s tickets and apply them to its index."""
+        tickets = await client.get_tickets(login, password)
+        return self.index(login).apply(tickets)